@@ -24,10 +24,18 @@ class SourceConfig:
             "postcodes": "Postnummer.xlsx",
         }
 
+        # (mtime_ns, parsed config) of the last read; reparse only when the file changes
+        self._cache: tuple[int, dict] | None = None
+
     def load(self) -> dict:
-        if not self.config_path.exists():
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return self.defaults.copy()
 
+        if self._cache and self._cache[0] == mtime:
+            return self._cache[1].copy()
+
         with open(self.config_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -35,12 +43,14 @@ class SourceConfig:
         for k, v in self.defaults.items():
             data.setdefault(k, v)
 
-        return data
+        self._cache = (mtime, data)
+        return data.copy()
 
     def save(self, cfg: dict):
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w", encoding="utf-8") as f:
             json.dump(cfg, f, indent=2, ensure_ascii=False)
+        self._cache = None
 
     def copy_to_input(self, key: str, source_file: Path) -> Path:
         filename = self.defaults[key]
@@ -2,16 +2,42 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from .normalize import normalize_text
+from noedudkald.persistence.source_cache import load_cached, store_cached
 
+from .normalize import normalize_series, normalize_text
 
-@dataclass(frozen=True)
+# Bump when load() changes the shape/content of the cached DataFrame
+_CACHE_VERSION = 5
+
+# First 4-digit run in "Postnr/bynavn", e.g. "4000 ROSKILDE" -> "4000"
+_POSTCODE_RE = re.compile(r"(\d{4})")
+
+# The only sheet columns load() uses
+_REQUIRED_COLUMNS = ["DOA-nr", "Adresse", "Postnr/bynavn", "Navn", "Primær udrykning", "Sekundær udrykning", "Status"]
+
+# Columns AbaSite is built from, kept as plain str arrays after load()
+_SITE_COLUMNS = (
+    "DOA-nr",
+    "Navn",
+    "address_display",
+    "address_norm",
+    "key_basic",
+    "Primær udrykning",
+    "Sekundær udrykning",
+    "Status",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class AbaSite:
     doa_no: str
     name: str
@@ -26,72 +52,104 @@ class AbaDirectory:
     def __init__(self, xlsx_path: str | Path):
         self.xlsx_path = Path(xlsx_path)
         self._df: pd.DataFrame | None = None
+        self._by_addr_norm: dict[str, int] = {}
+        self._by_key_basic: dict[str, int] = {}
+        self._key_arr: np.ndarray | None = None
+        self._token_index: dict[str, set[int]] = {}
+        self._arr: dict[str, np.ndarray] = {}
+        self._score_arr: np.ndarray | None = None
+        # Bounded memo of _match_components() (street, house_no, house_letter, postcode); cleared on load()
+        self._match_components_cached = lru_cache(maxsize=4096)(self._match_components)
 
     def load(self) -> None:
-        df = pd.read_excel(self.xlsx_path)
+        # Parsed + cleaned sheet is cached on disk, keyed by the Excel file's mtime/size
+        df = load_cached("aba", self.xlsx_path, _CACHE_VERSION)
+        if df is None:
+            df = self._read_sheet()
+            store_cached("aba", self.xlsx_path, _CACHE_VERSION, df)
+
+        # Hash indexes for the exact-key lookups (row positions; first row wins on duplicates)
+        self._by_addr_norm = {}
+        for i, k in enumerate(df["address_norm"]):
+            self._by_addr_norm.setdefault(k, i)
+        self._by_key_basic = {}
+        for i, k in enumerate(df["key_basic"]):
+            self._by_key_basic.setdefault(k, i)
+        self._key_arr = df["key_basic"].to_numpy(dtype=str)
+
+        # Inverted index token -> rows, used to narrow the contains-fallback in match_components
+        self._token_index = {}
+        for i, key in enumerate(df["key_basic"].tolist()):
+            for token in set(key.split()):
+                self._token_index.setdefault(token, set()).add(i)
+
+        # Plain per-column arrays for building AbaSite without pandas row access
+        self._arr = {c: np.array([str(v) for v in df[c].tolist()], dtype=object) for c in _SITE_COLUMNS}
+        self._score_arr = df["_aba_score"].to_numpy()
+        self._match_components_cached.cache_clear()
+
+        self._df = df
+
+    def _read_sheet(self) -> pd.DataFrame:
+        # calamine (Rust) is much faster than the default openpyxl engine; everything is
+        # handled as text below, so skip pandas' type inference and unused columns as well
+        df = pd.read_excel(
+            self.xlsx_path,
+            engine="calamine",
+            usecols=lambda c: c in _REQUIRED_COLUMNS,
+            dtype=str,
+        )
+        missing = [c for c in _REQUIRED_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"ABA Excel missing columns: {missing}")
+
         # Normalize status once
-        df["Status"] = df["Status"].fillna("").astype(str).str.strip()
+        df["Status"] = df["Status"].fillna("").str.strip()
         df["_status_norm"] = df["Status"].str.lower()
 
         # STRICT: only consider ABA sites that are in drift
         # (covers "Drift", "I drift", etc. — adjust if you truly mean exactly "Drift")
         df = df[df["_status_norm"].str.contains(r"\bdrift\b", na=False)].copy()
 
-        required = ["DOA-nr", "Adresse", "Postnr/bynavn", "Navn", "Primær udrykning", "Sekundær udrykning", "Status"]
-        missing = [c for c in required if c not in df.columns]
-        if missing:
-            raise ValueError(f"ABA Excel missing columns: {missing}")
-
-        df["Adresse"] = df["Adresse"].astype(str).str.strip()
-        df["Postnr/bynavn"] = df["Postnr/bynavn"].astype(str).str.strip()
-        df["Navn"] = df["Navn"].fillna("").astype(str).str.strip()
-
-        # Normalize response fields (avoid NaN / stray whitespace)
-        df["Primær udrykning"] = df["Primær udrykning"].fillna("").astype(str).str.strip()
-        df["Sekundær udrykning"] = df["Sekundær udrykning"].fillna("").astype(str).str.strip()
-        df["Status"] = df["Status"].fillna("").astype(str).str.strip()
+        # Clean the remaining text columns in one pass over the kept rows (avoid NaN / stray whitespace)
+        for col in ("Adresse", "Postnr/bynavn", "Navn", "Primær udrykning", "Sekundær udrykning"):
+            df[col] = df[col].fillna("").str.strip()
 
         # Human-readable display
         df["address_display"] = df["Adresse"] + ", " + df["Postnr/bynavn"]
 
         # Normalized display (useful for debugging / legacy match)
-        df["address_norm"] = df["address_display"].map(normalize_text)
+        df["address_norm"] = normalize_series(df["address_display"])
 
         # Key for robust matching: "Adresse" + 4-digit postcode only
-        df["postcode4"] = df["Postnr/bynavn"].astype(str).str.extract(r"(\d{4})")[0].fillna("")
-        df["key_basic"] = (df["Adresse"].astype(str).str.strip() + " " + df["postcode4"]).map(normalize_text)
+        # Fast path: the postcode normally leads the field, so a slice is enough; the regex
+        # only runs for the rows that don't start with 4 digits.
+        postcode4 = df["Postnr/bynavn"].str[:4]
+        odd = ~postcode4.str.isdecimal() | (postcode4.str.len() < 4)
+        if odd.any():
+            postcode4[odd] = df.loc[odd, "Postnr/bynavn"].str.extract(_POSTCODE_RE)[0].fillna("")
+        df["postcode4"] = postcode4
+        df["key_basic"] = normalize_series(df["Adresse"] + " " + df["postcode4"])
 
         # Prefer the "best" row when multiple ABA sites share the same address key.
         # This prevents *FEJL* rows from "winning" just because they appear first in the Excel file.
-        def _aba_row_score(r: pd.Series) -> int:
-            prim = str(r.get("Primær udrykning", "")).strip()
-            sec = str(r.get("Sekundær udrykning", "")).strip()
-            status = str(r.get("Status", "")).strip().lower()
-            name = str(r.get("Navn", "")).strip()
+        # Columns above are already filled + stripped, so the score is plain column arithmetic.
+        prim = df["Primær udrykning"]
+        sec = df["Sekundær udrykning"]
 
-            score = 0
+        # Primary response quality (strongly penalize known bad rows)
+        score = np.where(prim.isin(["", "-", "*FEJL*"]), 0, 100) - 100 * (prim == "*FEJL*").astype(int)
 
-            # Primary response quality
-            if prim and prim not in ("-", "*FEJL*"):
-                score += 100
-            elif prim == "*FEJL*":
-                score -= 100  # strongly penalize known bad rows
+        # Secondary response quality (nice to have, not required)
+        score += 10 * ((sec != "") & ~sec.isin(["-", "*FEJL*"])).astype(int)
 
-            # Secondary response quality (nice to have, not required)
-            if sec and sec not in ("-", "*FEJL*"):
-                score += 10
+        # Prefer active/in-service statuses
+        score += 5 * df["_status_norm"].str.contains("drift|aktiv|in service", regex=True, na=False).astype(int)
 
-            # Prefer active/in-service statuses
-            if any(k in status for k in ("drift", "aktiv", "i drift", "in service")):
-                score += 5
+        # Tiny preference for named sites
+        score += (df["Navn"] != "").astype(int)
 
-            # Tiny preference for named sites
-            if name:
-                score += 1
-
-            return score
-
-        df["_aba_score"] = df.apply(_aba_row_score, axis=1)
+        df["_aba_score"] = score
 
         # Sort so best rows appear first per key, then keep the best.
         df = (
@@ -100,32 +158,22 @@ class AbaDirectory:
               .reset_index(drop=True)
         )
 
-        self._df = df
+        # Low-cardinality text columns: store as categoricals (int codes + small lookup table)
+        for col in ("Status", "postcode4", "Primær udrykning"):
+            df[col] = df[col].astype("category")
+
+        return df
 
     def match_address(self, address_display: str) -> Optional[AbaSite]:
         if self._df is None:
             raise RuntimeError("AbaDirectory not loaded. Call load().")
 
         key = normalize_text(address_display)
-        hit = self._df[self._df["address_norm"] == key]
-        if hit.empty:
+        idx = self._by_addr_norm.get(key)
+        if idx is None:
             return None
 
-        r = hit.iloc[0]
-
-        # Guard: if the "best" available row is still unusable, treat as no match
-        if str(r["Primær udrykning"]).strip() == "*FEJL*":
-            return None
-
-        return AbaSite(
-            doa_no=str(r["DOA-nr"]),
-            name=str(r["Navn"]),
-            address_display=str(r["address_display"]),
-            address_norm=str(r["address_norm"]),
-            primary_response=str(r["Primær udrykning"]),
-            secondary_response=str(r["Sekundær udrykning"]),
-            status=str(r["Status"]),
-        )
+        return self._site_at(idx, "address_norm")
 
     def match_components(self, street: str, house_no: str, house_letter: str, postcode: str):
         if self._df is None:
@@ -135,35 +183,55 @@ class AbaDirectory:
         hn = str(house_no).strip()
         hl = str(house_letter or "").strip()
 
+        # The same address is matched repeatedly (candidate flags, resolve); the contains
+        # fallback in particular is worth not repeating
+        return self._match_components_cached(str(street), hn, hl, pc)
+
+    def _match_components(self, street: str, hn: str, hl: str, pc: str) -> Optional[AbaSite]:
         key_with_letter = normalize_text(f"{street} {hn} {hl} {pc}".strip())
         key_no_letter = normalize_text(f"{street} {hn} {pc}".strip())
 
-        hit = self._df[self._df["key_basic"] == key_with_letter]
-        if hit.empty:
-            hit = self._df[self._df["key_basic"] == key_no_letter]
+        idx = self._by_key_basic.get(key_with_letter)
+        if idx is None:
+            idx = self._by_key_basic.get(key_no_letter)
 
-        if hit.empty:
+        if idx is None:
             must_contain = normalize_text(f"{street} {hn} {pc}")
-            hit = self._df[self._df["key_basic"].str.contains(must_contain, na=False)]
+            pos = self._rows_containing(must_contain)
+            if pos.size == 0:
+                return None
+            # If multiple candidates survive fallback contains-match, pick the highest score.
+            idx = int(pos[np.argmax(self._score_arr[pos])])
 
-        if hit.empty:
-            return None
+        return self._site_at(idx, "key_basic")
 
-        # If multiple candidates survive fallback contains-match, pick the highest score.
-        if "_aba_score" in hit.columns and len(hit) > 1:
-            hit = hit.sort_values("_aba_score", ascending=False)
+    def _site_at(self, i: int, norm_col: str) -> Optional[AbaSite]:
+        a = self._arr
 
-        r = hit.iloc[0]
-
-        if str(r["Primær udrykning"]).strip() == "*FEJL*":
+        # Guard: if the "best" available row is still unusable, treat as no match
+        if a["Primær udrykning"][i].strip() == "*FEJL*":
             return None
 
         return AbaSite(
-            doa_no=str(r["DOA-nr"]),
-            name=str(r["Navn"]),
-            address_display=str(r["address_display"]),
-            address_norm=str(r.get("key_basic", "")),
-            primary_response=str(r["Primær udrykning"]),
-            secondary_response=str(r["Sekundær udrykning"]),
-            status=str(r["Status"]),
+            doa_no=a["DOA-nr"][i],
+            name=a["Navn"][i],
+            address_display=a["address_display"][i],
+            address_norm=a[norm_col][i],
+            primary_response=a["Primær udrykning"][i],
+            secondary_response=a["Sekundær udrykning"][i],
+            status=a["Status"][i],
         )
+
+    def _rows_containing(self, must_contain: str) -> np.ndarray:
+        """
+        Row positions whose key_basic contains must_contain as a substring.
+        Interior tokens of the pattern must be whole tokens of a matching key (the first/last
+        may be partial), so their posting lists narrow the rows before the substring check.
+        """
+        inner = must_contain.split()[1:-1]
+        if not inner:
+            return np.flatnonzero(np.char.find(self._key_arr, must_contain) >= 0)
+
+        postings = sorted((self._token_index.get(t, set()) for t in inner), key=len)
+        pos = np.fromiter(sorted(postings[0].intersection(*postings[1:])), dtype=np.intp)
+        return pos[np.char.find(self._key_arr[pos], must_contain) >= 0]
@@ -1,17 +1,26 @@
 # src/noedudkald/data_sources/addresses.py
 from __future__ import annotations
 
+import csv
+import hashlib
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
-from difflib import SequenceMatcher
 
+import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz, process
 
-from .normalize import normalize_address, normalize_text
+from noedudkald.persistence.source_cache import load_cached, store_cached
 
+from .normalize import normalize_address, normalize_series, normalize_text
 
-@dataclass(frozen=True)
+# Bump when load() changes the shape/content of the cached DataFrame
+_CACHE_VERSION = 6
+
+
+@dataclass(frozen=True, slots=True)
 class KnownAddress:
     display: str
     norm_key: str
@@ -24,7 +33,7 @@ class KnownAddress:
     city: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManualAddress:
     display: str
     street: str
@@ -35,30 +44,78 @@ class ManualAddress:
     district_no: str  # user-supplied when not known
 
 
+# Columns read from the 112 address CSV (any others are skipped while parsing)
+_CSV_COLUMNS = (
+    "Distrikt nummer",
+    "Vejnavn",
+    "Hus nummer",
+    "Hus bogstav",
+    "Område navn",
+    "Postnummer",
+)
+
+# DataFrame columns backing KnownAddress, in field order
+_KNOWN_ADDRESS_COLS = (
+    "display",
+    "norm_key",
+    "Distrikt nummer",
+    "Vejnavn",
+    "Hus nummer",
+    "Hus bogstav",
+    "Område navn",
+    "Postnummer",
+    "city",
+)
+
+
 class AddressDirectory:
     def __init__(self, csv_path: str | Path):
         self.csv_path = Path(csv_path)
         self._df: pd.DataFrame | None = None
         self._known_postcodes: set[str] = set()
+        # Distinct normalized streets (+ per-row code into them)
+        self._street_code: np.ndarray = np.empty(0, dtype=np.intp)
+        self._streets: np.ndarray = np.empty(0, dtype=str)
 
     # --------------------------------------------------
     # LOAD
     # --------------------------------------------------
     def load(self, postcode_to_city: dict[str, str] | None = None) -> None:
-        df = pd.read_csv(self.csv_path, sep=",", dtype=str).fillna("")
-
-        required = [
-            "Distrikt nummer",
-            "Vejnavn",
-            "Hus nummer",
-            "Hus bogstav",
-            "Område navn",
-            "Postnummer",
-        ]
-        missing = [c for c in required if c not in df.columns]
+        # Parsed + precomputed table is cached on disk, keyed by the CSV's mtime/size
+        # (and the postcode map, since it feeds the city/display columns)
+        city_key = ""
+        if postcode_to_city:
+            city_key = hashlib.sha1(
+                json.dumps(sorted(postcode_to_city.items()), ensure_ascii=False).encode("utf-8")
+            ).hexdigest()
+
+        df = load_cached("addresses", self.csv_path, _CACHE_VERSION, extra=city_key)
+        if df is None:
+            df = self._read_csv(postcode_to_city)
+            store_cached("addresses", self.csv_path, _CACHE_VERSION, df, extra=city_key)
+
+        self._known_postcodes = set(df["postcode_norm"].unique())
+        self._build_street_index(df)
+        self._df = df
+
+    def _build_street_index(self, df: pd.DataFrame) -> None:
+        codes, streets = pd.factorize(df["street_norm"])
+        self._street_code = codes
+        self._streets = np.asarray(streets, dtype=str)
+
+    def _read_csv(self, postcode_to_city: dict[str, str] | None) -> pd.DataFrame:
+        # Check the header first, then parse only the columns we use
+        with open(self.csv_path, encoding="utf-8-sig", newline="") as f:
+            header = next(csv.reader(f), [])
+
+        missing = [c for c in _CSV_COLUMNS if c not in header]
         if missing:
             raise ValueError(f"Address CSV missing columns: {missing}")
 
+        df = pd.read_csv(
+            self.csv_path, sep=",", dtype=str, usecols=list(_CSV_COLUMNS)
+        ).fillna("")
+
         df["Vejnavn"] = df["Vejnavn"].str.strip()
         df["Hus nummer"] = df["Hus nummer"].str.strip()
         df["Hus bogstav"] = df["Hus bogstav"].str.strip()
@@ -66,12 +123,14 @@ class AddressDirectory:
         df["Postnummer"] = df["Postnummer"].str.strip()
 
         if postcode_to_city:
-            df["city"] = df["Postnummer"].map(postcode_to_city).fillna("")
+            # Look each distinct postcode up once, then gather by category code
+            pc = df["Postnummer"].astype("category").cat
+            cities = pc.categories.map(lambda p: postcode_to_city.get(p, "")).to_numpy(dtype=object)
+            df["city"] = cities[pc.codes.to_numpy()]
         else:
             df["city"] = ""
 
-        area_part = df["Område navn"].where(df["Område navn"].str.len() > 0, "")
-        area_part = area_part.apply(lambda s: f" {s}" if s else "")
+        area_part = (" " + df["Område navn"]).where(df["Område navn"] != "", "")
 
         df["display"] = (
                 df["Vejnavn"]
@@ -85,19 +144,29 @@ class AddressDirectory:
                 + df["city"]
         ).str.strip()
 
-        df["norm_key"] = df["display"].map(normalize_text)
+        df["norm_key"] = normalize_series(df["display"])
 
         # ---------- Precompute for fast search ----------
-        df["street_norm"] = df["Vejnavn"].map(normalize_text)
-        df["house_norm"] = df["Hus nummer"].astype(str).str.strip()
-        df["letter_norm"] = df["Hus bogstav"].astype(str).str.strip()
-        df["area_norm"] = df["Område navn"].astype(str).str.strip()
-        df["postcode_norm"] = df["Postnummer"].astype(str).str.strip()
+        # (source columns are already stripped strings above; letters are compared case-insensitively)
+        df["street_norm"] = normalize_series(df["Vejnavn"])
+        df["house_norm"] = df["Hus nummer"]
+        df["letter_norm"] = df["Hus bogstav"].str.lower()
+        df["area_norm"] = df["Område navn"]
+        df["postcode_norm"] = df["Postnummer"]
 
-        self._known_postcodes = set(df["postcode_norm"].unique())
-        df["postcode_in_112"] = df["postcode_norm"].isin(self._known_postcodes).astype(int)
+        known_postcodes = set(df["postcode_norm"].unique())
+        df["postcode_in_112"] = df["postcode_norm"].isin(known_postcodes).astype(int)
 
-        self._df = df
+        # Low-cardinality text columns: store as categoricals (int codes + small lookup table)
+        for col in ("Postnummer", "postcode_norm", "Distrikt nummer", "city"):
+            df[col] = df[col].astype("category")
+
+        return df
+
+    @staticmethod
+    def _to_known_addresses(hit: pd.DataFrame) -> list[KnownAddress]:
+        rows = hit[list(_KNOWN_ADDRESS_COLS)].itertuples(index=False, name=None)
+        return [KnownAddress(*r) for r in rows]
 
     # --------------------------------------------------
     # STRICT MATCH
@@ -120,32 +189,15 @@ class AddressDirectory:
         ]
 
         if extra_n:
-            hit = hit[hit["letter_norm"].str.lower() == extra_n.lower()]
+            hit = hit[hit["letter_norm"] == extra_n.lower()]
 
         hit = hit.head(limit)
 
-        return [
-            KnownAddress(
-                display=r["display"],
-                norm_key=r["norm_key"],
-                district_no=r["Distrikt nummer"],
-                street=r["Vejnavn"],
-                house_no=r["Hus nummer"],
-                house_letter=r["Hus bogstav"],
-                area=r["Område navn"],
-                postcode=r["Postnummer"],
-                city=r["city"],
-            )
-            for _, r in hit.iterrows()
-        ]
+        return self._to_known_addresses(hit)
 
     # --------------------------------------------------
     # GOOGLE STYLE FUZZY FALLBACK
     # --------------------------------------------------
-    @staticmethod
-    def _sim(a: str, b: str) -> float:
-        return SequenceMatcher(None, a, b).ratio()
-
     def find_fuzzy_street_house(
         self,
         street: str,
@@ -168,56 +220,38 @@ class AddressDirectory:
         df = self._df
 
         # 1) strict house filter
-        cand = df[df["house_norm"] == house_q]
-        if cand.empty:
+        house_hit = (df["house_norm"] == house_q).to_numpy()
+        if not house_hit.any():
             return []
+        cand = df[house_hit]
 
-        # 2) letter preference
+        # Streets are scored once per distinct street, then spread back over the rows
+        uniq, inv = np.unique(self._street_code[house_hit], return_inverse=True)
+        streets = self._streets[uniq]
+        prefix = np.char.startswith(streets, street_q)
+
+        # 2) edit-distance scoring (one batched similarity call)
+        street_score = (
+            process.cdist([street_q], streets, scorer=fuzz.ratio, dtype=np.float64, workers=-1)[0] / 100.0
+            + np.where(streets == street_q, 0.20, np.where(prefix, 0.10, 0.0))
+        )
+        score = street_score[inv]
+
+        # 3) letter preference
         if letter_q:
-            cand = cand.assign(
-                _letter_bonus=(cand["letter_norm"].str.lower() == letter_q.lower()).astype(int)
-            )
-        else:
-            cand = cand.assign(_letter_bonus=0)
-
-        # 3) scoring
-        def score_row(r) -> float:
-            s = self._sim(street_q, r["street_norm"])
-            if r["street_norm"] == street_q:
-                s += 0.20
-            elif r["street_norm"].startswith(street_q):
-                s += 0.10
-            s += 0.05 * float(r["_letter_bonus"])
-            return s
-
-        cand = cand.copy()
-        cand["_score"] = cand.apply(score_row, axis=1)
-
-        cand = cand[cand["_score"] >= min_score]
-        if cand.empty:
+            score += 0.05 * (cand["letter_norm"].to_numpy(dtype=str) == letter_q.lower())
+
+        keep = np.flatnonzero(score >= min_score)
+        if keep.size == 0:
             return []
 
-        # 4) sort: 112 postcodes first, then best similarity
-        cand = cand.sort_values(
-            by=["postcode_in_112", "_score"],
-            ascending=[False, False],
-            kind="mergesort",
-        ).head(limit)
-
-        return [
-            KnownAddress(
-                display=r["display"],
-                norm_key=r["norm_key"],
-                district_no=r["Distrikt nummer"],
-                street=r["Vejnavn"],
-                house_no=r["Hus nummer"],
-                house_letter=r["Hus bogstav"],
-                area=r["Område navn"],
-                postcode=r["Postnummer"],
-                city=r["city"],
-            )
-            for _, r in cand.iterrows()
-        ]
+        # 4) sort: 112 postcodes first, then best similarity (lexsort is stable, like mergesort)
+        in_112 = cand["postcode_in_112"].to_numpy()[keep]
+        order = keep[np.lexsort((-score[keep], -in_112))][:limit]
+
+        cand = cand.iloc[order]
+
+        return self._to_known_addresses(cand)
 
 
 def make_manual_address(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from noedudkald.data_sources.aba import AbaDirectory
@@ -25,10 +26,11 @@ class DataHub:
         )
 
     def load_all(self):
-        self.addresses.load()
-        self.aba.load()
-        self.incidents.load()
-        self.postcodes.load()
+        # The sources are independent and mostly file I/O + parsing, so load them side by side.
+        # list() drains the results so the first loader exception is re-raised here.
+        loaders = [self.addresses.load, self.aba.load, self.incidents.load, self.postcodes.load]
+        with ThreadPoolExecutor(max_workers=len(loaders)) as ex:
+            list(ex.map(lambda load: load(), loaders))
 
     def reload_all(self) -> None:
         # same as load_all for now; later we can add caching/invalidation
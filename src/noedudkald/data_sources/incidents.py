@@ -1,62 +1,89 @@
 # src/noedudkald/data_sources/incidents.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
+import numpy as np
 
+from noedudkald.persistence.source_cache import load_cached, store_cached
 
-@dataclass(frozen=True)
+from .xlsx import cell_str, iter_sheets
+
+# Bump when load() changes the shape/content of the cached profiles
+_CACHE_VERSION = 4
+
+
+@dataclass(frozen=True, slots=True)
 class IncidentProfile:
     district_no: str
     incident_code: str
     incident_label: str
-    units: list[str]
+    units: tuple[str, ...]
 
 
 class IncidentMatrix:
     def __init__(self, xlsx_path: str | Path):
         self.xlsx_path = Path(xlsx_path)
         self._by_district: dict[str, dict[str, IncidentProfile]] = {}
+        self._flat: dict[tuple[str, str], IncidentProfile] = {}
 
     def load(self) -> None:
-        xl = pd.ExcelFile(self.xlsx_path)
-        self._by_district.clear()
+        # Parsed workbook is cached on disk, keyed by the Excel file's mtime/size
+        by_district = load_cached("incidents", self.xlsx_path, _CACHE_VERSION)
+        if by_district is None:
+            by_district = self._read_workbook()
+            store_cached("incidents", self.xlsx_path, _CACHE_VERSION, by_district)
 
-        for sheet in xl.sheet_names:
-            district_no = str(sheet).strip()
-            df = pd.read_excel(self.xlsx_path, sheet_name=sheet)
+        # Single-lookup index for get_profile(); _by_district stays for list_incidents()
+        self._flat = {(d, code): p for d, profiles in by_district.items() for code, p in profiles.items()}
+        self._by_district = by_district
 
-            # In your file, incident code column becomes "Unnamed: 0"
-            if "Unnamed: 0" not in df.columns:
-                raise ValueError(f"Pickliste sheet '{sheet}' missing 'Unnamed: 0' (incident code column).")
+    def _read_workbook(self) -> dict[str, dict[str, IncidentProfile]]:
+        by_district: dict[str, dict[str, IncidentProfile]] = {}
 
-            code_col = "Unnamed: 0"
+        for sheet, header, rows in iter_sheets(self.xlsx_path):
+            district_no = sys.intern(str(sheet).strip())
+
+            # In your file, the incident code column has no header (pandas called it "Unnamed: 0")
+            if not header or cell_str(header[0]):
+                raise ValueError(f"Pickliste sheet '{sheet}' missing 'Unnamed: 0' (incident code column).")
 
             # The incident label is in the second column; header varies per sheet, so just take col index 1
-            if len(df.columns) < 2:
+            if len(header) < 2:
                 raise ValueError(f"Pickliste sheet '{sheet}' has too few columns.")
-            label_col = df.columns[1]
 
             # Determine which columns are unit columns: everything from col index 5 onward
             # (based on your file: first columns are metadata flags/notes)
-            unit_cols = list(df.columns[5:])
+            # (names are interned, so every profile of the sheet shares the same unit strings)
+            unit_names = np.array(
+                [
+                    sys.intern(cell_str(h) or f"Unnamed: {j}")
+                    for j, h in enumerate(header[5:], start=5)
+                ],
+                dtype=object,
+            )
+
+            # "X" marks a unit for the incident; classify every unit cell of the sheet in one go
+            cells = np.array([r[5:len(header)] for r in rows], dtype=object).reshape(len(rows), len(unit_names))
+            marks = np.strings.strip(cells.astype(str))
+            is_x = (marks == "X") | (marks == "x")
+
+            # All hits at once, row-major: row i's units are unit_hits[bounds[i]:bounds[i + 1]]
+            hit_rows, hit_cols = np.nonzero(is_x)
+            unit_hits = unit_names[hit_cols].tolist()
+            bounds = np.searchsorted(hit_rows, np.arange(len(rows) + 1)).tolist()
 
             district_map: dict[str, IncidentProfile] = {}
-            for _, r in df.iterrows():
-                incident_code = str(r[code_col]).strip()
+            for i, r in enumerate(rows):
+                incident_code = cell_str(r[0])
                 if not incident_code or incident_code.lower() == "nan":
                     continue
 
-                incident_label = str(r[label_col]).strip()
-
-                units: list[str] = []
-                for uc in unit_cols:
-                    val = r.get(uc)
-                    if pd.notna(val) and str(val).strip().upper() == "X":
-                        units.append(str(uc).strip())
+                incident_label = cell_str(r[1])
+                units = tuple(unit_hits[bounds[i]:bounds[i + 1]])
 
                 district_map[incident_code] = IncidentProfile(
                     district_no=district_no,
@@ -65,12 +92,14 @@ class IncidentMatrix:
                     units=units,
                 )
 
-            self._by_district[district_no] = district_map
+            by_district[district_no] = district_map
+
+        return by_district
 
     def get_profile(self, district_no: str, incident_code: str) -> Optional[IncidentProfile]:
         district_no = str(district_no).strip()
         incident_code = str(incident_code).strip()
-        return self._by_district.get(district_no, {}).get(incident_code)
+        return self._flat.get((district_no, incident_code))
 
     def list_incidents(self, district_no: str) -> list[IncidentProfile]:
         district_no = str(district_no).strip()
@@ -2,10 +2,33 @@
 from __future__ import annotations
 
 import re
-
 import unicodedata
+from functools import lru_cache
+
+import pandas as pd
+
+
+# Non-word characters (letters/digits/underscore kept, Danish letters explicitly too)
+_NON_WORD_RE = re.compile(r"[^\wÆØÅ]")
+
+
+class _NonWordToSpace(dict):
+    """
+    str.translate() table mapping every non-word character to a space and every other
+    character to itself. Filled lazily, so each code point is classified only once.
+    """
 
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        out = " " if _NON_WORD_RE.match(ch) else ch
+        self[codepoint] = out
+        return out
 
+
+_NON_WORD_TABLE = _NonWordToSpace()
+
+
+@lru_cache(maxsize=65536)
 def normalize_text(s: str) -> str:
     """
     Normalize for matching (case-insensitive, whitespace/punctuation tolerant).
@@ -14,15 +37,27 @@ def normalize_text(s: str) -> str:
     if s is None:
         return ""
     s = str(s).strip()
-    s = unicodedata.normalize("NFKC", s)
+
+    # NFKC is a no-op for ASCII-only input
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s)
     s = s.upper()
 
-    # Replace punctuation with spaces (keep letters/numbers)
-    s = re.sub(r"[^\wÆØÅ]", " ", s, flags=re.UNICODE)
+    # Replace punctuation with spaces (keep letters/numbers), then collapse whitespace
+    return " ".join(s.translate(_NON_WORD_TABLE).split())
 
-    # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+
+def normalize_series(s: pd.Series) -> pd.Series:
+    """
+    Column-wise normalize_text(): same steps, run through pandas' vectorized
+    string methods instead of one Python call per row.
+    """
+    # Object dtype keeps the regexes on Python's re: with pyarrow strings they would run on RE2,
+    # where \w is ASCII-only and "Müllersvej" would lose its Ü (keys must equal normalize_text()'s)
+    s = s.fillna("").astype(str).astype(object).str.strip()
+    s = s.str.normalize("NFKC").str.upper()
+    s = s.str.replace(_NON_WORD_RE, " ", regex=True)
+    return s.str.replace(r"\s+", " ", regex=True).str.strip().astype(str)
 
 
 def normalize_address(street: str, house_no: str | int | None, house_letter: str | None,
@@ -30,7 +65,8 @@ def normalize_address(street: str, house_no: str | int | None, house_letter: str
     """
     Builds a normalized key like: 'HOVEDGADEN 12 A 4000'
     """
-    parts = [street, str(house_no) if house_no is not None else "", house_letter or "",
-             str(postcode) if postcode is not None else ""]
-    raw = " ".join(p for p in parts if p and str(p).strip())
-    return normalize_text(raw)
+    # normalize_text collapses the blanks left by empty parts, so no filtering is needed here
+    return normalize_text(
+        f"{street or ''} {house_no if house_no is not None else ''} "
+        f"{house_letter or ''} {postcode if postcode is not None else ''}"
+    )
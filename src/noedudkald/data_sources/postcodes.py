@@ -3,10 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-import pandas as pd
+from noedudkald.persistence.source_cache import load_cached, store_cached
 
+from .xlsx import cell_str, read_sheet
 
-@dataclass(frozen=True)
+# Bump when load() changes the content of the cached map
+_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
 class PostcodeEntry:
     postcode: str
     city: str
@@ -23,27 +28,39 @@ class PostcodeDirectory:
         self._map: dict[str, str] = {}
 
     def load(self) -> None:
+        # Parsed map is cached on disk, keyed by the Excel file's mtime/size
+        cached = load_cached("postcodes", self.xlsx_path, _CACHE_VERSION)
+        if cached is not None:
+            self._map = cached
+            return
+
         try:
-            df = pd.read_excel(self.xlsx_path)
+            header, rows = read_sheet(self.xlsx_path)
 
             required = ["Postnr", "By"]
-            missing = [c for c in required if c not in df.columns]
+            missing = [c for c in required if c not in header]
             if missing:
                 raise ValueError(
                     f"Postnummer.xlsx is missing columns {missing}.\n"
-                    f"Found columns: {list(df.columns)}"
+                    f"Found columns: {list(header)}"
                 )
 
-            df["Postnr"] = df["Postnr"].astype(str).str.strip()
-            df["By"] = df["By"].astype(str).str.strip()
+            pc_col = header.index("Postnr")
+            city_col = header.index("By")
 
-            self._map = dict(zip(df["Postnr"], df["By"]))
+            # Column-wise lists, then one C-level dict(zip(...)); rows without a postcode are dropped
+            postcodes = [cell_str(r[pc_col]) for r in rows]
+            cities = [cell_str(r[city_col]) for r in rows]
+            self._map = dict(zip(postcodes, cities))
+            self._map.pop("", None)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to read Postnummer file: {self.xlsx_path}\n"
                 f"Original error: {e}"
             )
 
+        store_cached("postcodes", self.xlsx_path, _CACHE_VERSION, self._map)
+
     def city_for_postcode(self, postcode: str) -> str:
         return self._map.get(str(postcode).strip(), "")
 
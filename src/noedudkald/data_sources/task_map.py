@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
+from noedudkald.persistence.source_cache import load_cached, store_cached
 
+from .xlsx import cell_str, read_sheet
 
-@dataclass(frozen=True)
+# Bump when load() changes the content of the cached map
+_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
 class TaskSelectionResult:
     task_ids: list[int]
     missing_units: list[str]
@@ -25,57 +31,67 @@ class TaskMap:
     """
 
     # Task IDs that do NOT trigger assistance auto-alert
-    ASSIST_EXCLUDE_TASK_IDS = {823, 3134, 7040, 6509, 3176, 7035, 7036, 7037, 5474, 1268}
+    ASSIST_EXCLUDE_TASK_IDS = frozenset({823, 3134, 7040, 6509, 3176, 7035, 7036, 7037, 5474, 1268})
 
     def __init__(self, path: str | Path, sheet_name: str | None = None):
         self.path = Path(path)
         self.sheet_name = sheet_name
         self._map: dict[str, list[int]] = {}
+        # Ass.Dag / Ass.Nat task ids, resolved once per load()
+        self._assist_ids: dict[str, list[int]] = {}
 
     def load(self) -> None:
-        if self.sheet_name is None:
-            df = pd.read_excel(self.path)
-        else:
-            df = pd.read_excel(self.path, sheet_name=self.sheet_name)
+        # Parsed map is cached on disk, keyed by the Excel file's mtime/size (and the sheet)
+        sheet_key = self.sheet_name or ""
+        out = load_cached("task_map", self.path, _CACHE_VERSION, extra=sheet_key)
+        if out is None:
+            out = self._read_sheet()
+            store_cached("task_map", self.path, _CACHE_VERSION, out, extra=sheet_key)
+
+        self._map = out
+        self._assist_ids = {unit: out.get(unit, []) for unit in ("Ass.Dag", "Ass.Nat")}
 
-        # df = pd.read_excel(self.path, sheet_name=self.sheet_name)
+    def _read_sheet(self) -> dict[str, list[int]]:
+        header, rows = read_sheet(self.path, self.sheet_name)
 
         # Expected columns in your file: unit, task_id
-        cols = {str(c).strip().lower(): c for c in df.columns}
+        cols = {cell_str(c).lower(): j for j, c in enumerate(header)}
         unit_col = cols.get("unit")
         task_col = cols.get("task_id")
 
-        if not unit_col or not task_col:
-            raise ValueError(f"TaskIds.xlsx must have columns 'unit' and 'task_id'. Found: {list(df.columns)}")
+        if unit_col is None or task_col is None:
+            raise ValueError(f"TaskIds.xlsx must have columns 'unit' and 'task_id'. Found: {list(header)}")
 
-        df = df[[unit_col, task_col]].copy()
-        df[unit_col] = df[unit_col].astype(str).str.strip()
+        units = [cell_str(r[unit_col]) for r in rows]
+        raw_ids = [r[task_col] for r in rows]
 
         out: dict[str, list[int]] = {}
-        for _, r in df.iterrows():
-            unit = str(r[unit_col]).strip()
+        for unit, raw in zip(units, raw_ids):
             if not unit:
                 continue
-            ids = self._parse_task_ids(r[task_col])
+            ids = self._parse_task_ids(raw)
             if not ids:
                 continue
-            out[unit] = ids
+            out[unit] = list(ids)
 
-        self._map = out
+        return out
 
     @staticmethod
-    def _parse_task_ids(value) -> list[int]:
+    @lru_cache(maxsize=4096)
+    def _parse_task_ids(value) -> tuple[int, ...]:
         """
         Handles:
-          - 823 or 823.0 -> [823]
-          - 3134.1268 -> [3134, 1268]
+          - 823 or 823.0 -> (823,)
+          - 3134.1268 -> (3134, 1268)
+
+        The same cell values recur across units, so results are memoized (hence a tuple).
         """
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return []
+        if value is None or (isinstance(value, float) and value != value):  # NaN != NaN
+            return ()
 
         s = str(value).strip()
 
-        # pandas/openpyxl read numbers as floats; keep the "3134.1268" string
+        # Excel readers return numbers as floats; keep the "3134.1268" string
         if "." in s:
             left, right = s.split(".", 1)
             left = left.strip()
@@ -89,14 +105,13 @@ class TaskMap:
                 ids.append(int(right))
 
             # de-dup, keep order
-            seen = set()
-            return [x for x in ids if not (x in seen or seen.add(x))]
+            return tuple(dict.fromkeys(ids))
 
         # plain integer-like
         try:
-            return [int(float(s))]
+            return (int(float(s)),)
         except Exception:
-            return []
+            return ()
 
     def task_ids_for_unit(self, unit: str) -> list[int] | None:
         return self._map.get(unit.strip())
@@ -127,8 +142,7 @@ class TaskMap:
                 task_ids.extend(ids)
 
         # de-dup, keep order
-        seen = set()
-        task_ids = [x for x in task_ids if not (x in seen or seen.add(x))]
+        task_ids = list(dict.fromkeys(task_ids))
 
         assistance_added = False
         assistance_unit = None
@@ -146,14 +160,11 @@ class TaskMap:
                 # Mon–Fri daytime => Ass.Dag, otherwise Ass.Nat
                 assistance_unit = "Ass.Dag" if (is_weekday and is_daytime) else "Ass.Nat"
 
-                ass_ids = self.task_ids_for_unit(assistance_unit) or []
+                ass_ids = self._assist_ids.get(assistance_unit, [])
 
                 # Only add if mapping exists
                 if ass_ids:
-                    for tid in ass_ids:
-                        if tid not in seen:
-                            task_ids.append(tid)
-                            seen.add(tid)
+                    task_ids = list(dict.fromkeys([*task_ids, *ass_ids]))
                     assistance_added = True
 
         return TaskSelectionResult(
@@ -0,0 +1,61 @@
+# src/noedudkald/data_sources/xlsx.py
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+from python_calamine import CalamineWorkbook
+
+Row = list[Any]
+
+
+def cell_str(value: Any) -> str:
+    """Cell value as stripped text ("" for empty cells; whole numbers without ".0")."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def _split_header(rows: list[Row]) -> tuple[Row, list[Row]]:
+    # Like pandas: leading blank rows are skipped and the first non-blank row is the header.
+    # calamine returns a rectangular grid, so data rows are always as wide as the header.
+    for i, row in enumerate(rows):
+        if not all(_is_blank(v) for v in row):
+            return row, rows[i + 1:]
+    return [], []
+
+
+def _sheet_rows(wb: CalamineWorkbook, name: str) -> list[Row]:
+    # Keep leading empty rows/columns so column positions match the sheet
+    return wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+
+
+def iter_sheets(xlsx_path: str | Path) -> Iterator[tuple[str, Row, list[Row]]]:
+    """
+    Yields (sheet_name, header, data_rows) for every sheet, in workbook order.
+    The workbook is opened once and each sheet is parsed in a single calamine (Rust) call;
+    no DataFrames are built. Empty cells are "" and numbers come back as float.
+    """
+    wb = CalamineWorkbook.from_path(str(xlsx_path))
+    try:
+        for name in wb.sheet_names:
+            header, rows = _split_header(_sheet_rows(wb, name))
+            yield name, header, rows
+    finally:
+        wb.close()
+
+
+def read_sheet(xlsx_path: str | Path, sheet_name: str | None = None) -> tuple[Row, list[Row]]:
+    """(header, data_rows) of the named sheet, or the first sheet when no name is given."""
+    wb = CalamineWorkbook.from_path(str(xlsx_path))
+    try:
+        name = wb.sheet_names[0] if sheet_name is None else sheet_name
+        return _split_header(_sheet_rows(wb, name))
+    finally:
+        wb.close()
@@ -1,10 +1,38 @@
 from __future__ import annotations
 
+import json
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Status codes meaning the token/credentials were rejected
+_AUTH_FAIL = frozenset({401, 403})
+
+# orjson decodes faster than the stdlib when it happens to be installed; not a hard dependency
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def make_session() -> requests.Session:
+    """
+    Keep-alive session with a small connection pool. Only failed connects are retried
+    (the request never reached FSR), so a POST can't create the same incident twice.
+    """
+    retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 @dataclass
@@ -15,9 +43,8 @@ class TokenInfo:
     expires_at: Optional[int] = None  # unix epoch seconds
 
     def is_expired(self, skew_seconds: int = 30) -> bool:
-        if self.expires_at is None:
-            return False
-        return time.time() >= (self.expires_at - skew_seconds)
+        # No expiry known -> never expires
+        return self.expires_at is not None and time.time() >= self.expires_at - skew_seconds
 
 
 class FireServiceRotaError(RuntimeError):
@@ -39,10 +66,10 @@ class FireServiceRotaClient:
         """
         Return JSON if present; otherwise raise a useful error showing status + body.
         """
-        text = (r.text or "").strip()
+        body = r.content or b""
         ctype = (r.headers.get("Content-Type") or "").lower()
 
-        if not text:
+        if not body.strip():
             raise FireServiceRotaError(
                 f"FSR returned empty response body (status {r.status_code}). "
                 f"Content-Type={r.headers.get('Content-Type')!r}"
@@ -50,26 +77,33 @@ class FireServiceRotaClient:
 
         # If it's not JSON, show the first part of body for diagnosis
         if "json" not in ctype:
-            snippet = text[:500]
+            snippet = r.text.strip()[:500]
             raise FireServiceRotaError(
                 f"FSR returned non-JSON response (status {r.status_code}). "
                 f"Content-Type={r.headers.get('Content-Type')!r}. "
                 f"Body (first 500 chars): {snippet}"
             )
 
+        # Decode straight from the raw bytes (no intermediate r.text decode)
         try:
-            return r.json()
+            return _json_loads(body)
         except Exception as e:
-            snippet = text[:500]
+            snippet = r.text.strip()[:500]
             raise FireServiceRotaError(
                 f"Failed to parse JSON from FSR (status {r.status_code}): {e}. "
                 f"Body (first 500 chars): {snippet}"
             )
 
-    def __init__(self, base_url: str = "https://www.fireservicerota.co.uk", timeout_s: int = 20):
+    def __init__(
+        self,
+        base_url: str = "https://www.fireservicerota.co.uk",
+        timeout_s: int = 20,
+        session: requests.Session | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout_s = timeout_s
-        self.session = requests.Session()
+        # Pass a shared session to reuse its open (TLS) connections across clients
+        self.session = session or make_session()
 
         self._token: Optional[TokenInfo] = None
         self._persist_token_cb = None  # type: ignore
@@ -97,7 +131,7 @@ class FireServiceRotaClient:
             data["client_id"] = client_id
 
         r = self.session.post(url, data=data, timeout=self.timeout_s)
-        if r.status_code in (401, 403):
+        if r.status_code in _AUTH_FAIL:
             raise FireServiceRotaAuthError(f"FSR login failed ({r.status_code}). Check credentials.")
         if not r.ok:
             raise FireServiceRotaError(f"FSR token request failed ({r.status_code}): {r.text}")
@@ -122,7 +156,7 @@ class FireServiceRotaClient:
         }
 
         r = self.session.post(url, data=data, timeout=self.timeout_s)
-        if r.status_code in (401, 403):
+        if r.status_code in _AUTH_FAIL:
             raise FireServiceRotaAuthError("Refresh token rejected. Please login again.")
         if not r.ok:
             raise FireServiceRotaError(f"FSR token refresh failed ({r.status_code}): {r.text}")
@@ -164,9 +198,10 @@ class FireServiceRotaClient:
 
         expires_at = None
         # APIs commonly return expires_in seconds
-        if "expires_in" in payload and payload["expires_in"] is not None:
+        expires_in = payload.get("expires_in")
+        if expires_in is not None:
             try:
-                expires_at = int(time.time()) + int(payload["expires_in"])
+                expires_at = int(time.time()) + int(expires_in)
             except Exception:
                 expires_at = None
 
@@ -212,7 +247,7 @@ class FireServiceRotaClient:
             payload["override_responder_membership_ids"] = override_responder_membership_ids
 
         r = self.session.post(url, json=payload, headers=headers, timeout=self.timeout_s)
-        if r.status_code in (401, 403):
+        if r.status_code in _AUTH_FAIL:
             self.refresh_access_token()
             headers["Authorization"] = f"{self._token.token_type} {self._token.access_token}"
             r = self.session.post(url, json=payload, headers=headers, timeout=self.timeout_s)
@@ -263,7 +298,7 @@ class FireServiceRotaClient:
             r2 = self.session.post(url, headers=self._headers(), json={}, timeout=self.timeout_s)
             last_status = r2.status_code
 
-            if r2.status_code in (401, 403):
+            if r2.status_code in _AUTH_FAIL:
                 return True, False
 
             if r2.status_code == 404:
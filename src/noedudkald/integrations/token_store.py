@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
 from dataclasses import asdict
-from json import JSONDecodeError
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,36 @@ class TokenStore:
     def __init__(self, path: Path):
         self.path = path
 
+        # The send and startup-check clients may persist refreshed tokens from two pool threads
+        self._lock = threading.Lock()
+
+        # (mtime_ns, parsed file) of the last read; reparse only when the file changes
+        self._cache: tuple[int, dict | None] | None = None
+
+    def _read_all(self) -> Optional[dict]:
+        """
+        Parsed token file, or None if it is missing, empty or not valid JSON.
+        load() and load_username() share this, so the file is parsed once per change.
+        """
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if self._cache and self._cache[0] == mtime:
+            data = self._cache[1]
+        else:
+            try:
+                raw = self.path.read_text(encoding="utf-8").strip()
+                data = json.loads(raw) if raw else None
+            except (OSError, ValueError):
+                data = None
+            if not isinstance(data, dict):
+                data = None
+            self._cache = (mtime, data)
+
+        return dict(data) if data is not None else None
+
     def save(self, token: TokenInfo, username: str | None = None) -> None:
         """
         Save token + optional username.
@@ -20,35 +52,33 @@ class TokenStore:
         """
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-        existing_user = None
-        if username is None and self.path.exists():
-            try:
-                raw = self.path.read_text(encoding="utf-8").strip()
-                if raw:
-                    data = json.loads(raw)
-                    existing_user = data.get("username")
-            except Exception:
-                existing_user = None
+        with self._lock:
+            existing_user = None
+            if username is None:
+                existing_user = (self._read_all() or {}).get("username")
 
-        data = asdict(token)
-        if username:
-            data["username"] = username
-        elif existing_user:
-            data["username"] = existing_user
+            data = asdict(token)
+            if username:
+                data["username"] = username
+            elif existing_user:
+                data["username"] = existing_user
 
-        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            # Write to a uniquely named temp file and swap it in, so a crash mid-write can't leave
+            # a broken token file and two writers never share (and steal) one temp path
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.path.parent, prefix=self.path.name, suffix=".tmp", delete=False
+            ) as f:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
+            try:
+                os.replace(f.name, self.path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+            self._cache = None
 
     def load(self) -> Optional[TokenInfo]:
-        if not self.path.exists():
-            return None
-
-        raw = self.path.read_text(encoding="utf-8").strip()
-        if not raw:
-            return None
-
-        try:
-            data = json.loads(raw)
-        except JSONDecodeError:
+        data = self._read_all()
+        if not data:
             return None
 
         # allow optional metadata
@@ -63,17 +93,10 @@ class TokenStore:
             return None
 
     def load_username(self) -> Optional[str]:
-        if not self.path.exists():
-            return None
-        try:
-            raw = self.path.read_text(encoding="utf-8").strip()
-            if not raw:
-                return None
-            data = json.loads(raw)
-            return data.get("username")
-        except Exception:
-            return None
+        data = self._read_all()
+        return data.get("username") if data else None
 
     def clear(self) -> None:
         if self.path.exists():
             self.path.unlink()
+        self._cache = None
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from noedudkald.persistence.runtime_paths import missing_files
 from noedudkald.ui.qt_app import run_gui
 
 
@@ -47,9 +48,8 @@ def default_paths() -> AppPaths:
 
 
 def ensure_files_exist(paths: AppPaths) -> None:
-    missing = [p for p in
-               [paths.addresses_csv, paths.aba_xlsx, paths.pickliste_xlsx, paths.postnummer_xlsx, paths.taskids_xlsx] if
-               not p.exists()]
+    required = [paths.addresses_csv, paths.aba_xlsx, paths.pickliste_xlsx, paths.postnummer_xlsx, paths.taskids_xlsx]
+    missing = missing_files(required)
     if missing:
         msg = (
                 "Missing datasource files:\n"
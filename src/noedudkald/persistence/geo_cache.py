@@ -0,0 +1,60 @@
+# src/noedudkald/persistence/geo_cache.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from noedudkald.persistence.runtime_paths import user_cache_dir
+
+
+def geo_key(address: str) -> str:
+    """Cache key: "Storgade 12" and "storgade  12," share a row."""
+    return " ".join(address.replace(",", " ").lower().split())
+
+
+class GeoCache:
+    """
+    Geocode results (lat, lon) that survive restarts, in a small sqlite file.
+    Best effort: if the database cannot be opened or written, lookups just miss.
+    Safe to call from worker threads.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or (user_cache_dir() / "geocache.db")
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS geo (key TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+            )
+        except (OSError, sqlite3.Error):
+            self._db = None
+
+    def get(self, address: str) -> tuple[float, float] | None:
+        if self._db is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT lat, lon FROM geo WHERE key = ?", (geo_key(address),)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, address: str, coords: tuple[float, float]) -> None:
+        if self._db is None:
+            return
+        lat, lon = coords
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO geo (key, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                    (geo_key(address), lat, lon, int(time.time())),
+                )
+        except sqlite3.Error:
+            pass
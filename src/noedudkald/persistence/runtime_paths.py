@@ -36,6 +36,27 @@ def user_data_dir() -> Path:
     return appdata_root() / "data"
 
 
+def user_cache_dir() -> Path:
+    # %APPDATA%\FSR-Backup-udkald\cache (parsed datasource caches, safe to delete)
+    return appdata_root() / "cache"
+
+
+def missing_files(required) -> list[Path]:
+    """
+    The paths in required that don't exist. Each folder is listed once instead of
+    stat'ing every file (normcase: case-insensitive on Windows).
+    """
+    listed: dict[Path, set[str]] = {}
+    for folder in {p.parent for p in required}:
+        try:
+            with os.scandir(folder) as it:
+                listed[folder] = {os.path.normcase(e.name) for e in it}
+        except OSError:
+            listed[folder] = set()
+
+    return [p for p in required if os.path.normcase(p.name) not in listed[p.parent]]
+
+
 def ensure_user_data_layout() -> Path:
     """
     Ensures %APPDATA% layout exists:
@@ -55,10 +76,12 @@ def ensure_user_data_layout() -> Path:
     bcfg = bundled_data_dir() / "config"
     ucfg = udata / "config"
     if bcfg.exists():
-        for p in bcfg.glob("*"):
-            if p.is_file():
-                target = ucfg / p.name
-                if not target.exists():
-                    shutil.copy2(p, target)
+        # One directory listing each (DirEntry caches the file type) instead of a stat per file
+        with os.scandir(ucfg) as it:
+            present = {os.path.normcase(e.name) for e in it}
+        with os.scandir(bcfg) as it:
+            for entry in it:
+                if entry.is_file() and os.path.normcase(entry.name) not in present:
+                    shutil.copy2(entry.path, ucfg / entry.name)
 
     return udata
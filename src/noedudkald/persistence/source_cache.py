@@ -0,0 +1,48 @@
+# src/noedudkald/persistence/source_cache.py
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from noedudkald.persistence.runtime_paths import user_cache_dir
+
+
+def _source_key(source: Path, version: int, extra: str) -> tuple:
+    st = source.stat()
+    return str(source.resolve()), st.st_mtime_ns, st.st_size, version, extra
+
+
+def _cache_file(name: str) -> Path:
+    return user_cache_dir() / f"{name}.pkl"
+
+
+def load_cached(name: str, source: Path, version: int, extra: str = "") -> Any | None:
+    """
+    Returns the value stored by store_cached() for this source, or None if there is
+    no cache or it is stale (source file changed, or different version/extra).
+    """
+    try:
+        key = _source_key(source, version, extra)
+        with open(_cache_file(name), "rb") as f:
+            cached_key, value = pickle.load(f)
+    except Exception:
+        return None
+
+    return value if cached_key == key else None
+
+
+def store_cached(name: str, source: Path, version: int, value: Any, extra: str = "") -> None:
+    """
+    Best effort: if the cache cannot be written, the next load just parses the source again.
+    """
+    path = _cache_file(name)
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump((_source_key(source, version, extra), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Final, Optional, Sequence, Union
 
 from noedudkald.data_sources.aba import AbaDirectory, AbaSite
 from noedudkald.data_sources.addresses import KnownAddress, ManualAddress
@@ -10,8 +11,11 @@ from noedudkald.rules.aba_rules import apply_aba_rules_case_sensitive, AbaRuleRe
 
 AddressType = Union[KnownAddress, ManualAddress]
 
+# Label used for BAAl, whose units come from the ABA list instead of the pickliste
+_BAAL_LABEL: Final = "Brandalarm (ABA)"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ResolvedCallout:
     address: KnownAddress
     district_no: str
@@ -28,14 +32,45 @@ class CalloutResolver:
         self.incidents = incidents
         self.aba = aba
 
+        # Per-resolver memo of _resolve(): the sources are fixed for a resolver's lifetime
+        # (a reload builds a new one), and the address records are frozen/hashable.
+        self._resolve_cached = lru_cache(maxsize=4096)(self._resolve)
+
     def resolve(
             self,
             selected_address: AddressType,
             incident_code: str,
             use_secondary_aba: bool = False,
     ) -> ResolvedCallout:
-        district_no = selected_address.district_no
         code = (incident_code or "").strip()  # case sensitive
+        return self._resolve_cached(selected_address, code, bool(use_secondary_aba))
+
+    def resolve_many(
+            self,
+            items: Sequence[tuple[AddressType, str, bool]],
+    ) -> tuple[list[Optional[ResolvedCallout]], list[tuple[int, ValueError]]]:
+        """
+        Resolves (address, incident_code, use_secondary_aba) items in one call.
+
+        Returns (results, errors): results[i] is None for items that could not be
+        resolved, and errors holds the (index, error) pairs for those, instead of
+        stopping at the first failure.
+        """
+        resolve = self._resolve_cached
+        results: list[Optional[ResolvedCallout]] = [None] * len(items)
+        errors: list[tuple[int, ValueError]] = []
+
+        for i, (address, incident_code, use_secondary) in enumerate(items):
+            try:
+                results[i] = resolve(address, (incident_code or "").strip(), bool(use_secondary))
+            except ValueError as e:
+                errors.append((i, e))
+
+        return results, errors
+
+    def _resolve(self, selected_address: AddressType, code: str, use_secondary_aba: bool) -> ResolvedCallout:
+        district_no = selected_address.district_no
+        is_baal = code == "BAAl"  # case sensitive
 
         # ABA match is needed for BAAl
         aba_site = self.aba.match_components(
@@ -49,15 +84,15 @@ class CalloutResolver:
         base_units: list[str] = []
         incident_label = ""
 
-        if code != "BAAl":
+        if not is_baal:
             profile = self.incidents.get_profile(district_no, code)
             if profile is None:
                 raise ValueError(f"Incident '{code}' not found for district '{district_no}'.")
             incident_label = profile.incident_label
-            base_units = profile.units
+            base_units = list(profile.units)
         else:
             # For BAAl, units come from ABA list, not pickliste
-            incident_label = "Brandalarm (ABA)"  # change text if you prefer
+            incident_label = _BAAL_LABEL  # change text if you prefer
 
         aba_rule = apply_aba_rules_case_sensitive(
             incident_code=code,
@@ -67,7 +102,7 @@ class CalloutResolver:
         )
 
         # For BAAl, require ABA match, otherwise the callout is not resolvable
-        if code == "BAAl" and aba_site is None:
+        if is_baal and aba_site is None:
             raise ValueError("BAAl selected but address is not found in ABA list (no response can be derived).")
 
         return ResolvedCallout(
@@ -77,6 +112,6 @@ class CalloutResolver:
             incident_label=incident_label,
             aba_site=aba_site,
             base_units=base_units,
-            final_units=aba_rule.units if aba_rule.applied or code == "BAAl" else base_units,
+            final_units=aba_rule.units if aba_rule.applied or is_baal else base_units,
             aba_rule=aba_rule,
         )
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
 
-@dataclass(frozen=True)
+# Fixed pieces of the alert text
+_ABA: Final = "ABA"
+_SEP: Final = "-"
+
+
+@dataclass(frozen=True, slots=True)
 class CalloutTextInput:
     incident_code: str  # e.g. "BAAl" or other
     incident_text: str  # e.g. "BRANDALARM" or "BYGN.BRAND-BUTIK"
@@ -21,13 +26,16 @@ def _format_address(address_display: str, city: str) -> str:
     # Prefer the full display (usually: "Street X, 4000 City")
     s = (address_display or "").strip()
     if s:
+        # str.replace (memchr-based) beats str.translate here: addresses are usually
+        # non-ASCII (æøå), which sends translate down its slow per-character path
         return s.replace(",", "")
     # Fallback only
     return (city or "").strip()
 
 
 def _units_to_str(units: list[str]) -> str:
-    return " ".join(u.strip() for u in units if u and u.strip())
+    # strip each unit once; empty/blank units are dropped
+    return " ".join([s for u in units if u and (s := u.strip())])
 
 
 def compose_alert_text(inp: CalloutTextInput, units: list[str]) -> str:
@@ -49,26 +57,24 @@ def compose_alert_text(inp: CalloutTextInput, units: list[str]) -> str:
     if inp.incident_code == "BAAl":
         # Keep ABA format
         parts = [
-            "ABA",
+            _ABA,
             address_part,
-            (inp.aba_site_name or "").strip(),
+            site,
             inp.priority,
             inp.incident_text,  # typically "BRANDALARM"
         ]
-        if comments:
-            parts.append(comments)
-        parts += ["-", units_part]
-        parts = [p for p in parts if p and p.strip()]
-        return " ".join(parts)
-
-    # Non-ABA format: incident text first, no prefix
-    parts = [
-        inp.incident_text,
-        address_part,
-        inp.priority,
-    ]
+    else:
+        # Non-ABA format: incident text first, no prefix
+        parts = [
+            inp.incident_text,
+            address_part,
+            inp.priority,
+        ]
+
     if comments:
         parts.append(comments)
-    parts += ["-", units_part]
-    parts = [p for p in parts if p and p.strip()]
-    return " ".join(parts)
+    parts.append(_SEP)
+    parts.append(units_part)
+
+    # Drop empty/blank pieces in the same pass as the join (isspace() doesn't allocate like strip())
+    return " ".join([p for p in parts if p and not p.isspace()])
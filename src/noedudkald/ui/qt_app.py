@@ -5,37 +5,94 @@ import re
 import time
 import urllib.parse
 import sys
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from string import Template
 from typing import Any
 
-import pandas as pd
 import requests
 from PySide6.QtCore import Qt, QStringListModel, QUrl, QRunnable, QThreadPool, Signal, QObject, QTimer, QSignalBlocker
+from PySide6.QtCore import QItemSelection
 from PySide6.QtGui import QFont, QIcon, QPixmap, QPainter, QColor, QPen
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QTextEdit, QListWidget, QListWidgetItem,
+    QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QListView, QAbstractItemView,
     QPushButton, QGroupBox, QMessageBox, QRadioButton, QButtonGroup,
     QCheckBox, QSplitter, QDialog, QCompleter, QSplashScreen, QProgressBar, QProgressDialog,
 )
 
-from noedudkald.data_sources.addresses import make_manual_address
+from noedudkald.data_sources.addresses import KnownAddress, make_manual_address
 from noedudkald.data_sources.data_hub import DataHub
 from noedudkald.data_sources.task_map import TaskMap
+from noedudkald.data_sources.xlsx import cell_str, iter_sheets
 from noedudkald.integrations.fireservicerota_client import FireServiceRotaClient, FireServiceRotaError, \
-    FireServiceRotaAuthError
+    FireServiceRotaAuthError, make_session
 from noedudkald.integrations.token_store import TokenStore
-from noedudkald.persistence.runtime_paths import ensure_user_data_layout
+from noedudkald.persistence.geo_cache import GeoCache, geo_key
+from noedudkald.persistence.runtime_paths import ensure_user_data_layout, missing_files
+from noedudkald.persistence.source_cache import load_cached, store_cached
 from noedudkald.rules.resolve_callout import CalloutResolver
 from noedudkald.rules.text_composer import CalloutTextInput, compose_alert_text
 from noedudkald.ui.settings_dialog import SettingsDialog, LoginDialog
 
 FSR_PRIORITY_MAP = {"Kørsel 1": "prio1", "Kørsel 2": "prio2"}
 
+# One keep-alive session for the FSR startup checks, so re-checks reuse the TLS connection
+_FSR_SESSION = make_session()
+
+# How long a startup-check FSR result is reused (e.g. when settings are closed again)
+_FSR_CHECK_TTL_S = 30.0
+
+# Log line timestamp (local time)
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Map preview: one Leaflet page, re-centred via setMarker() instead of reloading per address
+_LEAFLET_HTML = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
+<script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+<style>html, body, #map { height: 100%; margin: 0; }</style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+var map = L.map("map").setView([$lat, $lon], 16);
+L.tileLayer("https://tile.openstreetmap.org/{z}/{x}/{y}.png", {
+    maxZoom: 19,
+    attribution: "&copy; OpenStreetMap contributors"
+}).addTo(map);
+var marker = L.marker([$lat, $lon]).addTo(map);
+function setMarker(lat, lon) {
+    marker.setLatLng([lat, lon]);
+    map.setView([lat, lon], 16);
+}
+</script>
+</body>
+</html>
+""")
+
+# Bump when _read_incident_pairs() changes what it extracts
+_INCIDENT_PAIRS_CACHE_VERSION = 2
+
+# Looks like an incident code: 3-5 chars starting with letters (e.g. BAAl/BBBu)
+_CODE_RE = re.compile(r"^[A-Za-zÆØÅæøå]{2,4}[A-Za-z0-9ÆØÅæøå]{0,2}$")
+_WS_RE = re.compile(r"\s+")
+
+# Code-like token at the end of "Label — CODE" input (see _extract_incident_code)
+_INCIDENT_CODE_RE = re.compile(r"([A-Za-zÆØÅæøå]{2,4}[A-Za-z0-9ÆØÅæøå]{0,3})\s*$")
+
+# "(401)" style HTTP status in FireServiceRotaError messages
+_HTTP_CODE_RE = re.compile(r"\((\d{3})\)")
+
 
 def app_icon_path(project_root: Path) -> Path | None:
     """
@@ -67,6 +124,11 @@ class AppPaths:
     postnummer_xlsx: Path
     taskids_xlsx: Path
 
+    @property
+    def sources(self) -> tuple[Path, ...]:
+        """The five required datasource files."""
+        return self.addresses_csv, self.aba_xlsx, self.pickliste_xlsx, self.postnummer_xlsx, self.taskids_xlsx
+
 
 class BootSplash(QWidget):
     def __init__(self, pixmap: QPixmap):
@@ -141,6 +203,154 @@ class _StartupCheckWorker(QRunnable):
         self.signals.done.emit(sources_ok, fsr_ok, sources_msg, fsr_msg)
 
 
+_GEO_LOCK = threading.Lock()
+_geo_last_t = 0.0
+
+
+def geocode_nominatim(address: str) -> tuple[float, float] | None:
+    """
+    Returns (lat, lon) or None.
+    Uses Nominatim (OSM) with throttling; blocks, so call it from a worker thread.
+    """
+    global _geo_last_t
+
+    url = "https://nominatim.openstreetmap.org/search"
+    params = {"q": address, "format": "json", "limit": 1}
+    headers = {"User-Agent": "NoedudkaldRB/1.0 (dispatch tool)"}
+
+    # Polite throttling (Nominatim prefers <= 1 req/sec), shared by all workers
+    with _GEO_LOCK:
+        dt = time.time() - _geo_last_t
+        if dt < 1.0:
+            time.sleep(1.0 - dt)
+
+        try:
+            r = requests.get(url, params=params, headers=headers, timeout=10)
+            r.raise_for_status()
+            data = r.json()
+            if not data:
+                return None
+
+            lat = float(data[0]["lat"])
+            lon = float(data[0]["lon"])
+            _geo_last_t = time.time()
+            return lat, lon
+        except Exception:
+            return None
+
+
+class _GeoSignals(QObject):
+    done = Signal(str, object)  # address, (lat, lon) or None
+    skipped = Signal(str)  # address no longer shown when the worker got its turn
+
+
+class _GeoWorker(QRunnable):
+    def __init__(self, address: str, is_current):
+        super().__init__()
+        self.address = address
+        self.is_current = is_current  # callable(address) -> bool
+        self.signals = _GeoSignals()
+
+    def run(self):
+        # Lookups queue up behind the 1 req/s throttle; don't spend a slot on one nobody waits for
+        if not self.is_current(self.address):
+            self.signals.skipped.emit(self.address)
+            return
+        self.signals.done.emit(self.address, geocode_nominatim(self.address))
+
+
+class _SendSignals(QObject):
+    progress = Signal(int, object)  # 1-based index, task_id (about to be sent)
+    sent = Signal(int, object, object)  # 1-based index, task_id, incident id or None
+    finished = Signal(object)  # list[(task_id, incident id or None)]
+    failed = Signal(object)  # the exception
+
+
+class _SendWorker(QRunnable):
+    """Logs in (when creds are given) and creates one FSR incident per task id, off the UI thread."""
+
+    def __init__(self, client: FireServiceRotaClient, store: TokenStore, creds: tuple[str, str] | None,
+                 task_ids: list[int], body_text: str, prio: str, location: str):
+        super().__init__()
+        self.client = client
+        self.store = store
+        self.creds = creds
+        self.task_ids = task_ids
+        self.body_text = body_text
+        self.prio = prio
+        self.location = location
+        self.signals = _SendSignals()
+
+    def run(self):
+        try:
+            if self.creds:
+                username, password = self.creds
+                token = self.client.login_with_password(username, password)
+                self.store.save(token, username=username)
+                self.client.set_token(token)
+
+            created: list[tuple[int, str | int | None]] = []
+            for idx, task_id in enumerate(self.task_ids, start=1):
+                self.signals.progress.emit(idx, task_id)
+
+                result = self.client.create_incident(
+                    body_text=self.body_text,
+                    prio=self.prio,
+                    location=self.location,
+                    task_ids=[task_id],
+                )
+
+                inc_id = result.get("id") or result.get("incidentId")
+                created.append((task_id, inc_id))
+                self.signals.sent.emit(idx, task_id, inc_id)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+
+        self.signals.finished.emit(created)
+
+
+class _SourcesSignals(QObject):
+    done = Signal(int, object, object, object, object)  # generation, hub, task_map, resolver, incident pairs
+    failed = Signal(int, str)  # generation, error
+
+
+class _SourcesWorker(QRunnable):
+    """Builds a detached DataHub/TaskMap/CalloutResolver; touches no widgets."""
+
+    def __init__(self, generation: int, paths: AppPaths, get_incident_pairs):
+        super().__init__()
+        self.generation = generation
+        self.paths = paths
+        self.get_incident_pairs = get_incident_pairs
+        self.signals = _SourcesSignals()
+
+    def run(self):
+        try:
+            # Load core data (hub owns these)
+            hub = DataHub.from_paths(
+                self.paths.addresses_csv,
+                self.paths.aba_xlsx,
+                self.paths.pickliste_xlsx,
+                self.paths.postnummer_xlsx,
+            )
+            hub.load_all()
+
+            # Task IDs are separate (not in DataHub)
+            task_map = TaskMap(self.paths.taskids_xlsx)
+            task_map.load()
+
+            resolver = CalloutResolver(incidents=hub.incidents, aba=hub.aba)
+
+            # Expensive Excel parsing for the incident completer happens here too
+            pairs = self.get_incident_pairs()
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+
+        self.signals.done.emit(self.generation, hub, task_map, resolver, pairs)
+
+
 def detect_project_root() -> Path:
     """
     Robust root detection: walk upwards until we find data/input.
@@ -171,15 +381,13 @@ def default_paths() -> AppPaths:
     )
 
 
+def _parse_units(raw: str) -> list[str]:
+    # "bil1, st2 m3" -> ["BIL1", "ST2", "M3"]; split() already drops empty/whitespace-only pieces
+    return raw.upper().replace(",", " ").split()
+
+
 def ensure_files_exist(paths: AppPaths) -> None:
-    required = [
-        paths.addresses_csv,
-        paths.aba_xlsx,
-        paths.pickliste_xlsx,
-        paths.postnummer_xlsx,
-        paths.taskids_xlsx,
-    ]
-    missing = [p for p in required if not p.exists()]
+    missing = missing_files(paths.sources)
     if missing:
         raise FileNotFoundError(
             "Missing datasource files:\n" + "\n".join(f" - {m}" for m in missing)
@@ -200,6 +408,26 @@ class NoodudkaldQt(QMainWindow):
         self.task_map = None
         self.resolver = None
 
+        # Incremented per _reload_sources; only the latest load's result is applied
+        self._sources_gen = 0
+
+        # (monotonic ts, ok, msg, token mtime_ns) of the last FSR check
+        self._fsr_cache: tuple[float, bool, str, int | None] | None = None
+
+        # Send client + token store, created on first use and kept for keep-alive (see _fsr_send_client)
+        self._fsr_client: FireServiceRotaClient | None = None
+        self._fsr_store: TokenStore | None = None
+
+        # Postnr -> By, copied from hub.postcodes on load (looked up on every postnr keystroke)
+        self._postcode_city: dict[str, str] = {}
+
+        # KnownAddress -> candidate list label (built from the loaded sources)
+        self._label_cache: dict[KnownAddress, str] = {}
+
+        # Incident completer (created on the first source load, see _install_incident_completer)
+        self._incident_completer: QCompleter | None = None
+        self._incident_pairs: list[tuple[str, str]] | None = None  # pairs the search indexes were built from
+
         # --- Last resolved data ---
         self.last_alert_text: str | None = None
         self.last_task_ids: list[int] | None = None
@@ -211,9 +439,24 @@ class NoodudkaldQt(QMainWindow):
         self.last_city: str | None = None
         self.last_aba_site_name: str | None = None
 
+        # False right after a successful resolve; any input change sets it again (see _mark_dirty)
+        self._inputs_dirty = True
+
         # --- Address selection state ---
         self.selected_address = None
         self._candidates = []
+        self._candidate_map_addrs: list[str] = []  # clean address per candidate row (map/geocode)
+
+        # Progress dialog of the send in flight (see on_send)
+        self._send_progress: QProgressDialog | None = None
+
+        # --- Map preview state ---
+        self._geo_cache: dict[str, tuple[float, float] | None] = {}  # keyed by geo_key()
+        self._geo_db = GeoCache()
+        self._map_address: str | None = None
+        self._geo_inflight: set[str] = set()  # addresses with a queued/running _GeoWorker
+        self._map_leaflet = False  # Leaflet page (not the search fallback) is in map_view
+        self._map_page_loaded = False
 
         # --- Icon ---
         p = app_icon_path(self.paths.project_root)
@@ -230,13 +473,16 @@ class NoodudkaldQt(QMainWindow):
         # --- Build UI ---
         self._build_ui()
         self.thread_pool = QThreadPool.globalInstance()
+
+        # Geocoding gets its own single thread: lookups are throttled to 1/s and must never
+        # queue in front of FSR sends on the global pool
+        self._geo_pool = QThreadPool(self)
+        self._geo_pool.setMaxThreadCount(1)
         self._set_ready_state(False)
         self._set_header_status("Tjekker…", "info")
 
         # --- Startup behaviour ---
-        missing = self._missing_sources()
-
-        if missing:
+        if not self._has_all_sources():
             # First boot: no sources. Do NOT open settings yet (wait until splash is gone and window is visible)
             self._log("Program startet uden datakilder.")
             self._set_header_status("Mangler datakilder", "err")
@@ -249,16 +495,10 @@ class NoodudkaldQt(QMainWindow):
             self._run_startup_checks()
 
         else:
-            # Load sources while splash is visible
-            self._splash_msg("Indlæser datakilder...")
-
+            # Load sources while splash is visible; the startup checks run once they are in
+            # (also when loading fails, which ends in sources_ok=False)
             self._reload_sources()
 
-            # If load failed, hub/task_map/resolver were set to None and header/log updated.
-            # Still run checks to complete the splash lifecycle (will end in sources_ok=False).
-            self._splash_msg("Tester FSR...")
-            self._run_startup_checks()
-
     def _run_startup_checks(self):
         worker = _StartupCheckWorker(self)
         worker.signals.done.connect(self._on_startup_checked)
@@ -301,8 +541,7 @@ class NoodudkaldQt(QMainWindow):
         self.show()
 
     def _check_sources_ready(self) -> tuple[bool, str]:
-        missing = self._missing_sources()
-        if missing:
+        if not self._has_all_sources():
             return False, "Mangler datakilder"
 
         # NEW: require successful load (not just files existing)
@@ -324,12 +563,41 @@ class NoodudkaldQt(QMainWindow):
         """
         Returns (ok, message)
         ok=True kun når token findes og heartbeat-test viser auth OK.
+        The result is reused for _FSR_CHECK_TTL_S seconds unless the token file changes.
         """
-        udata = ensure_user_data_layout()
-        token_path = udata / "secrets" / "fsr_token.json"
-        store = TokenStore(token_path)
+        store = self._fsr_token_store()
+        try:
+            token_mtime = store.path.stat().st_mtime_ns
+        except OSError:
+            token_mtime = None
+
+        cached = self._fsr_cache
+        if cached and cached[3] == token_mtime and time.monotonic() - cached[0] < _FSR_CHECK_TTL_S:
+            return cached[1], cached[2]
+
+        ok, msg = self._probe_fsr(store)
+        self._fsr_cache = (time.monotonic(), ok, msg, token_mtime)
+        return ok, msg
 
-        client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk")
+    def _fsr_token_store(self) -> TokenStore:
+        if self._fsr_store is None:
+            udata = ensure_user_data_layout()
+            self._fsr_store = TokenStore(udata / "secrets" / "fsr_token.json")
+        return self._fsr_store
+
+    def _fsr_send_client(self) -> tuple[FireServiceRotaClient, TokenStore]:
+        """
+        The client used for sends, and its token store. Both live as long as the window, so repeated
+        sends reuse the client's HTTP session (connection + TLS) and the store's parsed token file.
+        """
+        store = self._fsr_token_store()
+        if self._fsr_client is None:
+            self._fsr_client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk")
+            self._fsr_client.set_persist_token_callback(lambda t: store.save(t))
+        return self._fsr_client, store
+
+    def _probe_fsr(self, store: TokenStore) -> tuple[bool, str]:
+        client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk", session=_FSR_SESSION)
         token = store.load()
 
         if token:
@@ -338,10 +606,12 @@ class NoodudkaldQt(QMainWindow):
         client.set_persist_token_callback(lambda t: store.save(t))
 
         if not token:
-            # server check uden login (health)
+            # server check uden login (health); HEAD is enough to tell online from offline
             try:
-                r = requests.get("https://www.fireservicerota.co.uk/api/v2/health", timeout=8)
-                return (False, "FSR login mangler") if r.ok else (False, "FSR offline")
+                r = _FSR_SESSION.head(
+                    "https://www.fireservicerota.co.uk/api/v2/health", timeout=4, allow_redirects=False
+                )
+                return (False, "FSR login mangler") if r.status_code < 500 else (False, "FSR offline")
             except Exception:
                 return False, "FSR offline"
 
@@ -485,8 +755,12 @@ class NoodudkaldQt(QMainWindow):
 
         # Candidates list (full-height)
         cand_box, cand_v = card("Kandidater")
-        self.candidate_list = QListWidget()
-        self.candidate_list.itemSelectionChanged.connect(self.on_candidate_selected)
+        # One string model, replaced in a single setStringList() per search (no per-row item objects)
+        self._cand_model = QStringListModel([], self)
+        self.candidate_list = QListView()
+        self.candidate_list.setModel(self._cand_model)
+        self.candidate_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.candidate_list.selectionModel().selectionChanged.connect(self.on_candidate_selected)
         cand_v.addWidget(self.candidate_list, 1)
 
         self.candidate_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -579,9 +853,12 @@ class NoodudkaldQt(QMainWindow):
         assist_v.addWidget(self.assist_units)
 
         map_box, map_v = card("Map preview")
-        self.map_view = QWebEngineView()
-        map_v.addWidget(self.map_view)
-        self.map_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # The web view (a Chromium instance) is created on first use, see _ensure_map_view
+        self.map_view: QWebEngineView | None = None
+        self._map_placeholder = QWidget()
+        self._map_placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._map_layout = map_v
+        map_v.addWidget(self._map_placeholder)
 
         mid_l.addWidget(inc_box)
         mid_l.addWidget(prio_box)
@@ -607,13 +884,22 @@ class NoodudkaldQt(QMainWindow):
         preview_box, preview_v = card("Gennemse")
         self.preview = QTextEdit()
         self.preview.setReadOnly(True)
+        self._preview_shown = ""  # text currently in the (read-only) preview, see _set_preview
         preview_v.addWidget(self.preview, 1)
 
         log_box, log_v = card("Log")
-        self.log = QTextEdit()
+        # Append-only log: QPlainTextEdit is much cheaper to append to than a rich-text QTextEdit
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
         log_v.addWidget(self.log, 1)
 
+        # Log lines are buffered and written in one append shortly after (see _log)
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)  # ms
+        self._log_timer.timeout.connect(self._flush_log)
+
         right_split.addWidget(preview_box)
         right_split.addWidget(log_box)
         right_split.setSizes([520, 340])
@@ -660,6 +946,14 @@ class NoodudkaldQt(QMainWindow):
         self.extra.returnPressed.connect(self.on_search)
         self.incident_code.returnPressed.connect(self.on_resolve)
 
+        # Any input change invalidates the last resolve, so Send re-resolves only when needed.
+        # units_edit is left out: on_send always rebuilds the alert and task ids from it.
+        for edit in (self.street, self.house, self.extra, self.manual_post, self.manual_city, self.incident_code,
+                     self.assist_incident_text, self.assist_units, self.comments):
+            edit.textChanged.connect(self._mark_dirty)
+        for button in (self.manual_assist, self.prio1, self.prio2, self.aba_s, self.aba_p):
+            button.toggled.connect(self._mark_dirty)
+
         self.street.setFocus()
 
         # Optional: light styling for a cleaner modern look (safe + subtle)
@@ -672,7 +966,7 @@ class NoodudkaldQt(QMainWindow):
                 left: 10px;
                 padding: 0 4px 0 4px;
             }
-            QLineEdit, QTextEdit, QListWidget {
+            QLineEdit, QTextEdit, QPlainTextEdit, QListView {
                 font-size: 12px;
             }
             QPushButton {
@@ -712,24 +1006,22 @@ class NoodudkaldQt(QMainWindow):
             self._aba_flag_cache[key] = ok
         return ok
 
-    def _format_candidate_label(self, a: Any) -> str:
-        street = str(getattr(a, "street", "")).strip()
-        house = str(getattr(a, "house_no", "")).strip()
-        letter = str(getattr(a, "house_letter", "")).strip()
-        area = str(getattr(a, "area", "")).strip()
-        post = str(getattr(a, "postcode", "")).strip()
-
-        city = str(getattr(a, "city", "")).strip()
-        if not city and self.hub is not None and post:
-            city = (self.hub.postcodes.city_for_postcode(post) or "").strip()
+    def _format_candidate_label(self, a: KnownAddress) -> str:
+        # Same address -> same label until sources are reloaded (KnownAddress is frozen, so hashable)
+        label = self._label_cache.get(a)
+        if label is None:
+            label = self._build_candidate_label(a)
+            self._label_cache[a] = label
+        return label
 
-        line1 = f"{street} {house}".strip()
-        if letter:
-            line1 = f"{line1} {letter}".strip()
-        if area:
-            line1 = f"{line1} {area}".strip()
+    def _build_candidate_label(self, a: KnownAddress) -> str:
+        # KnownAddress fields (and postcode-map cities) are already stripped strings,
+        # so the parts can be joined directly without re-stripping intermediates
+        post = a.postcode
+        city = a.city or (self._postcode_city.get(post, "") if post else "")
 
-        label = f"{line1}, {post} {city}".strip() if city else f"{line1}, {post}".strip()
+        line1 = " ".join(filter(None, (a.street, a.house_no, a.house_letter, a.area)))
+        label = f"{line1}, {post} {city}" if city else f"{line1}, {post}".rstrip()
 
         if self._is_aba_site_address(a):
             label = f"{label}  [ABA]"
@@ -741,73 +1033,89 @@ class NoodudkaldQt(QMainWindow):
         if not addr:
             return
 
-        coords = self._geocode_nominatim(addr)
+        # Only the latest request is shown; older lookups still fill the cache if already running
+        self._map_address = addr
+
+        hit, coords = self._geo_cache_get(addr)
+        if hit:
+            self._show_map(addr, coords)
+            return
+
+        if addr in self._geo_inflight:
+            return  # its result will be shown, since it is the current address again
+
+        # Geocode off the UI thread (network + throttling would otherwise freeze the window)
+        self._geo_inflight.add(addr)
+        worker = _GeoWorker(addr, lambda a: a == self._map_address)
+        worker.signals.done.connect(self._on_geo_done)
+        worker.signals.skipped.connect(self._on_geo_skipped)
+        self._geo_pool.start(worker)
+
+    def _on_geo_done(self, address: str, coords: tuple[float, float] | None) -> None:
+        self._geo_inflight.discard(address)
+        self._geo_cache_put(address, coords)
+        if address == self._map_address:
+            self._show_map(address, coords)
+
+    def _on_geo_skipped(self, address: str) -> None:
+        self._geo_inflight.discard(address)
+
+    def _geo_cache_get(self, address: str) -> tuple[bool, tuple[float, float] | None]:
+        """(hit, coords): session dict first, then the on-disk cache."""
+        key = geo_key(address)
+        if key in self._geo_cache:
+            return True, self._geo_cache[key]
+
+        coords = self._geo_db.get(address)
+        if coords is None:
+            return False, None
+        self._geo_cache[key] = coords
+        return True, coords
+
+    def _geo_cache_put(self, address: str, coords: tuple[float, float] | None) -> None:
+        self._geo_cache[geo_key(address)] = coords
+        # Misses/failures are only remembered for this session (could be a network error)
+        if coords is not None:
+            self._geo_db.put(address, coords)
+
+    def _ensure_map_view(self) -> QWebEngineView:
+        if self.map_view is None:
+            from PySide6.QtWidgets import QSizePolicy
+
+            self.map_view = QWebEngineView()
+            self.map_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.map_view.loadFinished.connect(self._on_map_load_finished)
+            self._map_layout.replaceWidget(self._map_placeholder, self.map_view)
+            self._map_placeholder.deleteLater()
+            self._map_placeholder = None
+        return self.map_view
+
+    def _show_map(self, addr: str, coords: tuple[float, float] | None) -> None:
+        self._ensure_map_view()
+
         if not coords:
             # Fallback: show OSM search (still ok, but has more UI)
             q = urllib.parse.quote(addr)
+            self._map_leaflet = False
+            self._map_page_loaded = False
             self.map_view.setUrl(QUrl(f"https://www.openstreetmap.org/search?query={q}"))
             return
 
         lat, lon = coords
 
-        # Clean embedded map view (no side panels)
-        # bbox gives a viewport around the marker
-        delta = 0.01
-        left = lon - delta
-        right = lon + delta
-        bottom = lat - delta
-        top = lat + delta
-
-        embed_url = (
-            "https://www.openstreetmap.org/export/embed.html"
-            f"?bbox={left}%2C{bottom}%2C{right}%2C{top}"
-            f"&layer=mapnik&marker={lat}%2C{lon}"
-        )
-
-        self.map_view.setUrl(QUrl(embed_url))
-
-    def _geocode_nominatim(self, address: str) -> tuple[float, float] | None:
-        """
-        Returns (lat, lon) or None.
-        Uses Nominatim (OSM) with basic caching + throttling.
-        """
-        address = (address or "").strip()
-        if not address:
-            return None
-
-        if not hasattr(self, "_geo_cache"):
-            self._geo_cache = {}
-            self._last_geo_t = 0.0
-
-        if address in self._geo_cache:
-            return self._geo_cache[address]
-
-        # Polite throttling (Nominatim prefers <= 1 req/sec)
-        now = time.time()
-        dt = now - self._last_geo_t
-        if dt < 1.0:
-            time.sleep(1.0 - dt)
+        if self._map_page_loaded:
+            # Map page is already up: just move the marker (no page reload)
+            self.map_view.page().runJavaScript(f"setMarker({lat}, {lon})")
+            return
 
-        url = "https://nominatim.openstreetmap.org/search"
-        params = {"q": address, "format": "json", "limit": 1}
-        headers = {"User-Agent": "NoedudkaldRB/1.0 (dispatch tool)"}
+        # First map (or after the search fallback): load the Leaflet page centred on the marker
+        html = _LEAFLET_HTML.substitute(lat=lat, lon=lon)
+        self._map_leaflet = True
+        self.map_view.setHtml(html, QUrl("https://www.openstreetmap.org/"))
 
-        try:
-            r = requests.get(url, params=params, headers=headers, timeout=10)
-            r.raise_for_status()
-            data = r.json()
-            if not data:
-                self._geo_cache[address] = None
-                return None
-
-            lat = float(data[0]["lat"])
-            lon = float(data[0]["lon"])
-            self._geo_cache[address] = (lat, lon)
-            self._last_geo_t = time.time()
-            return lat, lon
-        except Exception:
-            self._geo_cache[address] = None
-            return None
+    def _on_map_load_finished(self, ok: bool) -> None:
+        # setMarker() only exists once the Leaflet page has loaded
+        self._map_page_loaded = ok and self._map_leaflet
 
     def on_manual_post_changed(self, txt: str) -> None:
         post = (txt or "").strip()
@@ -818,7 +1126,7 @@ class NoodudkaldQt(QMainWindow):
             self.manual_city.setReadOnly(False)
             return
 
-        city = self.hub.postcodes.city_for_postcode(post) or ""
+        city = self._postcode_city.get(post, "")
         if city:
             self.manual_city.setText(city)
             self.manual_city.setReadOnly(True)  # lock it when we have a match
@@ -851,8 +1159,12 @@ class NoodudkaldQt(QMainWindow):
         if dlg.exec():
             self._set_header_status("Tjekker…", "info")
             self._set_ready_state(False)
-            self._reload_sources()
-            self._run_startup_checks()
+            # Sources only need reloading when a file was replaced; FSR status is cached briefly
+            # (a new login changes the token file, which invalidates it)
+            if dlg.changed or self.hub is None:
+                self._reload_sources()  # runs the startup checks when done
+            else:
+                self._run_startup_checks()
 
     def _get_incident_pairs(self) -> list[tuple[str, str]]:
         """
@@ -860,12 +1172,19 @@ class NoodudkaldQt(QMainWindow):
 
         Source of truth: RB Pickliste.xlsx (all sheets).
         This avoids depending on internal structure of hub.incidents.
+        The extracted pairs are cached on disk until Pickliste.xlsx changes.
         """
+        xlsx = self.paths.pickliste_xlsx
+        pairs = load_cached("incident_pairs", xlsx, _INCIDENT_PAIRS_CACHE_VERSION)
+        if pairs is None:
+            pairs = self._read_incident_pairs(xlsx)
+            store_cached("incident_pairs", xlsx, _INCIDENT_PAIRS_CACHE_VERSION, pairs)
+        return pairs
 
+    @staticmethod
+    def _read_incident_pairs(xlsx: Path) -> list[tuple[str, str]]:
         def norm(s: str) -> str:
-            return re.sub(r"\s+", "", str(s).strip().lower())
-
-        sheets = pd.read_excel(self.paths.pickliste_xlsx, sheet_name=None)
+            return _WS_RE.sub("", str(s).strip().lower())
 
         # Candidate column name patterns (Danish + English)
         code_keys = {"kode", "code", "incidentcode", "haendelsekode", "hændelsekode"}
@@ -874,13 +1193,24 @@ class NoodudkaldQt(QMainWindow):
         pairs: list[tuple[str, str]] = []
         seen = set()
 
-        for sheet_name, df in sheets.items():
-            if df is None or not hasattr(df, "columns"):
+        # Rows are read straight from the workbook; only the header and two columns are used
+        for sheet_name, header, rows in iter_sheets(xlsx):
+            if not header:
                 continue
 
-            cols = list(df.columns)
-            ncols = [norm(c) for c in cols]
-            colmap = {ncols[i]: cols[i] for i in range(len(cols))}
+            cols = range(len(header))
+            colmap = {}
+            for j in cols:
+                colmap.setdefault(norm(cell_str(header[j]) or f"Unnamed: {j}"), j)
+
+            samples: dict[int, list[str]] = {}
+
+            def sample(j: int) -> list[str]:
+                # First 50 non-empty cells of column j, stripped; shared by both heuristics
+                if j not in samples:
+                    vals = (cell_str(r[j]) for r in rows if r[j] is not None and r[j] != "")
+                    samples[j] = list(islice(vals, 50))
+                return samples[j]
 
             # Find best code column
             code_col = None
@@ -900,14 +1230,19 @@ class NoodudkaldQt(QMainWindow):
             # code column often has short values like "BBBu", "BAAl", etc.
             if code_col is None:
                 for c in cols:
-                    ser = df[c].dropna().astype(str).str.strip()
-                    if ser.empty:
+                    vals = sample(c)
+                    if not vals:
                         continue
-                    # Check if many values look like 3-5 chars starting with letters (e.g. BAAl/BBBu)
-                    sample = ser.head(50)
-                    hit = sample.str.match(r"^[A-Za-zÆØÅæøå]{2,4}[A-Za-z0-9ÆØÅæøå]{0,2}$").mean()
-                    if hit >= 0.6:
-                        code_col = c
+                    # Check if many values look like codes; stop counting once 60% is reached
+                    need = 0.6 * len(vals)
+                    hits = 0
+                    for v in vals:
+                        if _CODE_RE.match(v):
+                            hits += 1
+                            if hits >= need:
+                                code_col = c
+                                break
+                    if code_col is not None:
                         break
 
             # label heuristic: longer text column
@@ -917,10 +1252,10 @@ class NoodudkaldQt(QMainWindow):
                 best = None
                 best_len = 0.0
                 for c in candidate_cols:
-                    ser = df[c].dropna().astype(str).str.strip()
-                    if ser.empty:
+                    vals = sample(c)
+                    if not vals:
                         continue
-                    avg_len = ser.head(50).str.len().mean()
+                    avg_len = sum(map(len, vals)) / len(vals)
                     if avg_len > best_len:
                         best_len = avg_len
                         best = c
@@ -929,10 +1264,9 @@ class NoodudkaldQt(QMainWindow):
             if code_col is None or label_col is None:
                 continue
 
-            sub = df[[code_col, label_col]].dropna()
-            for _, r in sub.iterrows():
-                code = str(r[code_col]).strip()
-                label = str(r[label_col]).strip()
+            for r in rows:
+                code = cell_str(r[code_col])
+                label = cell_str(r[label_col])
                 if not code or not label:
                     continue
                 # de-dupe across districts/sheets
@@ -960,66 +1294,90 @@ class NoodudkaldQt(QMainWindow):
         if not enabled:
             self.aba_p.setChecked(True)
 
-    def _install_incident_completer(self) -> None:
+    def _install_incident_completer(self, pairs: list[tuple[str, str]]) -> None:
         """
         Fast incident search:
         - Debounce filtering (prevents UI freeze)
         - Only shows suggestions after 2 chars
         - Limits list to top N matches
+        pairs come from _get_incident_pairs() (run on the sources worker).
         """
-        # Cache all pairs once (expensive excel parsing happens here only)
-        pairs = self._get_incident_pairs()
         self._log(f"Hændelser indlæst til søgning: {len(pairs)}")
 
-        # Precompute searchable strings
-        self._incident_all = []
-        self._incident_display_to_code = {}
-        for code, label in pairs:
-            display = f"{label} — {code}"
-            self._incident_all.append((code, label, display, label.lower(), code.lower()))
-            self._incident_display_to_code[display] = code
-
-        # Model that we will update dynamically (small list)
-        self._incident_model = QStringListModel([], self)
+        # Search indexes only depend on the pairs; a reload with an unchanged pick list keeps them
+        if pairs != self._incident_pairs:
+            self._build_incident_index(pairs)
 
-        self._incident_completer = QCompleter(self._incident_model, self)
-        self._incident_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self._incident_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)  # <-- VIGTIG
-        self._incident_completer.setFilterMode(Qt.MatchContains)
+        # Widgets, timer and signal connections are set up once; a source reload only
+        # swaps the data above (re-connecting would run the handlers once per reload per key)
+        if self._incident_completer is None:
+            # Model that we will update dynamically (small list)
+            self._incident_model = QStringListModel([], self)
 
-        self.incident_code.setCompleter(self._incident_completer)
-        self._incident_completer.activated.connect(self._on_incident_chosen)
+            self._incident_completer = QCompleter(self._incident_model, self)
+            self._incident_completer.setCaseSensitivity(Qt.CaseInsensitive)
+            self._incident_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)  # <-- VIGTIG
+            self._incident_completer.setFilterMode(Qt.MatchContains)
 
+            self.incident_code.setCompleter(self._incident_completer)
+            self._incident_completer.activated.connect(self._on_incident_chosen)
 
-        # Debounce timer
-        self._incident_timer = QTimer(self)
-        self._incident_timer.setSingleShot(True)
-        self._incident_timer.setInterval(120)  # ms
+            # Debounce timer: suggestions are computed once the operator pauses typing
+            self._incident_timer = QTimer(self)
+            self._incident_timer.setSingleShot(True)
+            self._incident_timer.setInterval(120)  # ms
 
-        # When text edited: restart timer
-        self.incident_code.textEdited.connect(self._on_incident_text_edited)
-        self._incident_timer.timeout.connect(self._update_incident_suggestions)
+            # When text edited: restart timer
+            self.incident_code.textEdited.connect(self._on_incident_text_edited)
+            self._incident_timer.timeout.connect(self._update_incident_suggestions)
+        else:
+            self._incident_timer.stop()
 
         # Start empty
+        self._pending_incident_text = ""
         self._incident_model.setStringList([])
 
+    def _build_incident_index(self, pairs: list[tuple[str, str]]) -> None:
+        # Precompute searchable strings, as parallel lists (one entry per pair, same index)
+        self._incident_displays = [f"{label} — {code}" for code, label in pairs]
+        self._incident_labels_l = [label.lower() for _, label in pairs]
+        self._incident_codes_l = [code.lower() for code, _ in pairs]
+        self._incident_display_to_code = dict(zip(self._incident_displays, (code for code, _ in pairs)))
+
+        # trigram -> indices of entries whose label or code contains it
+        trigrams: dict[str, set[int]] = defaultdict(set)
+        for i, (label_l, code_l) in enumerate(zip(self._incident_labels_l, self._incident_codes_l)):
+            for text in (label_l, code_l):
+                for j in range(len(text) - 2):
+                    trigrams[text[j:j + 3]].add(i)
+        self._incident_trigrams = dict(trigrams)
+
+        # Entry indices ordered by lowercased label, for prefix lookups with bisect
+        labels_l = self._incident_labels_l
+        self._incident_prefix_idx = sorted(range(len(labels_l)), key=labels_l.__getitem__)
+        self._incident_prefix_keys = [labels_l[i] for i in self._incident_prefix_idx]
+
+        self._incident_pairs = pairs
+
     def _on_incident_text_edited(self, txt: str) -> None:
-        # Restart debounce timer on each key
-        self._incident_timer.stop()
+        # Keep the edited text (delivered with the signal) for the debounced update
+        self._pending_incident_text = txt or ""
+
+        # Restart debounce timer on each key (start() restarts a running timer)
         self._incident_timer.start()
 
     def _update_incident_suggestions(self) -> None:
-        q = (self.incident_code.text() or "").strip().lower()
+        raw = self._pending_incident_text.strip()
+        q = raw.lower()
 
         # Don’t suggest for 0–1 chars (prevents huge match set)
         if len(q) < 2:
             self._incident_model.setStringList([])
-            if self.incident_code.completer():
-                self.incident_code.completer().popup().hide()
+            comp = self.incident_code.completer()
+            if comp:
+                comp.popup().hide()
             return
 
-        raw = (self.incident_code.text() or "").strip()
-
         # Kun suppress hvis det ligner en rigtig incident-kode (typisk 3-5 tegn, mange store bogstaver)
         if 3 <= len(raw) <= 5 and raw.replace("-", "").isalnum():
             upper_count = sum(1 for ch in raw if ch.isalpha() and ch.isupper())
@@ -1032,12 +1390,38 @@ class NoodudkaldQt(QMainWindow):
                 return
 
         # Compute top matches (limit!)
-        matches = []
         limit = 40
 
-        for code, label, display, label_l, code_l in self._incident_all:
-            if q in label_l or q in code_l:
-                matches.append(display)
+        # Labels starting with the query come first: binary search in the sorted labels
+        keys = self._incident_prefix_keys
+        lo = bisect_left(keys, q)
+        hi = min(bisect_left(keys, q + "\uffff", lo), lo + limit)
+        prefix_hits = self._incident_prefix_idx[lo:hi]
+        displays = self._incident_displays
+        matches = [displays[i] for i in prefix_hits]
+
+        if len(matches) >= limit:
+            candidates = ()
+        elif len(q) < 3:
+            candidates = range(len(displays))
+        else:
+            # Only entries containing every trigram of the query can match
+            sets = [self._incident_trigrams.get(q[i:i + 3]) for i in range(len(q) - 2)]
+            if not all(sets):
+                candidates = ()
+            else:
+                sets.sort(key=len)
+                candidates = sorted(sets[0].intersection(*sets[1:]))
+
+        # Then fill up with labels/codes containing the query elsewhere
+        taken = set(prefix_hits)
+        labels_l = self._incident_labels_l
+        codes_l = self._incident_codes_l
+        for i in candidates:
+            if i in taken:
+                continue
+            if q in labels_l[i] or q in codes_l[i]:
+                matches.append(displays[i])
                 if len(matches) >= limit:
                     break
 
@@ -1048,6 +1432,12 @@ class NoodudkaldQt(QMainWindow):
             comp.setCompletionPrefix("")  # <-- VIGTIG: viser hele model-listen uden ekstra filtrering
             comp.complete()
 
+    def _cancel_incident_suggestions(self) -> None:
+        # A debounce tick still pending would re-open the popup for the old partial text
+        if self._incident_completer is not None:
+            self._incident_timer.stop()
+        self._pending_incident_text = ""
+
     def _on_incident_chosen(self, text: str) -> None:
         code = self._incident_display_to_code.get(text)
         if not code:
@@ -1060,6 +1450,7 @@ class NoodudkaldQt(QMainWindow):
         elif " - " in text:
             label = text.split(" - ")[0].strip()
 
+        self._cancel_incident_suggestions()
         blocker = QSignalBlocker(self.incident_code)
         try:
             self.incident_code.setText(code)
@@ -1085,16 +1476,18 @@ class NoodudkaldQt(QMainWindow):
         if not s:
             return ""
 
-        # Most common: label — CODE  (em dash)
-        if "—" in s:
-            s = s.split("—")[-1].strip()
+        # Most common: label — CODE  (em dash); rpartition scans once and builds no list
+        _, sep, tail = s.rpartition("—")
+        if sep:
+            s = tail.strip()
 
         # Also allow: label - CODE
-        if " - " in s:
-            s = s.split(" - ")[-1].strip()
+        _, sep, tail = s.rpartition(" - ")
+        if sep:
+            s = tail.strip()
 
         # Final safety: take a code-like token at end
-        m = re.search(r"([A-Za-zÆØÅæøå]{2,4}[A-Za-z0-9ÆØÅæøå]{0,3})\s*$", s)
+        m = _INCIDENT_CODE_RE.search(s)
         return m.group(1) if m else s
 
     def _sync_assistance_incident_text(self) -> None:
@@ -1141,8 +1534,20 @@ class NoodudkaldQt(QMainWindow):
             pass
         self._splash = None
     def _log(self, msg: str):
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log.append(f"[{ts}] {msg}")
+        self._log_buffer.append(f"[{time.strftime(_TS_FMT)}] {msg}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        # One relayout/repaint for the whole burst instead of one per line
+        self.log.setUpdatesEnabled(False)
+        try:
+            self.log.appendPlainText("\n".join(self._log_buffer))
+        finally:
+            self.log.setUpdatesEnabled(True)
+        self._log_buffer.clear()
 
     def _error(self, title: str, msg: str):
         QMessageBox.critical(self, title, msg)
@@ -1185,7 +1590,7 @@ class NoodudkaldQt(QMainWindow):
             raise ValueError("No candidate selected. Enter manual postal code.")
 
         if not city:
-            city = self.hub.postcodes.city_for_postcode(post) or ""
+            city = self._postcode_city.get(post, "")
         if not city:
             raise ValueError("City not found for postcode. Enter city manually.")
 
@@ -1208,10 +1613,16 @@ class NoodudkaldQt(QMainWindow):
 
     # ---------- events ----------
 
+    def _mark_dirty(self, *_) -> None:
+        self._inputs_dirty = True
+
     def on_search(self):
-        self.candidate_list.clear()
+        if self._cand_model.rowCount():
+            self._cand_model.setStringList([])
         self.selected_address = None
+        self._inputs_dirty = True
         self._candidates = []
+        self._candidate_map_addrs = []
 
         street = self.street.text().strip()
         house = self.house.text().strip()
@@ -1246,32 +1657,33 @@ class NoodudkaldQt(QMainWindow):
             self._info("No matches", popup, log_message="Adresse ikke fundet i 112-listen")
             return
 
-        self._candidates = candidates
-        for a in candidates:
-            label = self._format_candidate_label(a)
-
-            # Visible label (may include [ABA])
-            item = QListWidgetItem(label)
+        # Visible labels (may include [ABA])
+        labels = [self._format_candidate_label(a) for a in candidates]
 
-            # IMPORTANT: store clean address for map/geocode (never include [ABA])
-            raw_addr = getattr(a, "display", "") or label
-            item.setData(Qt.UserRole, raw_addr)
-
-            self.candidate_list.addItem(item)
+        # IMPORTANT: keep clean address for map/geocode (never include [ABA]), by row
+        self._candidates = candidates
+        self._candidate_map_addrs = [getattr(a, "display", "") or label for a, label in zip(candidates, labels)]
+        # One model reset for all rows; hold repaints until the view has laid them out
+        self.candidate_list.setUpdatesEnabled(False)
+        try:
+            self._cand_model.setStringList(labels)
+        finally:
+            self.candidate_list.setUpdatesEnabled(True)
 
         self._log(f"Found {len(candidates)} candidate(s). Select one.")
 
-    def on_candidate_selected(self):
-        items = self.candidate_list.selectedItems()
-        if not items:
+    def on_candidate_selected(self, selected: QItemSelection, _deselected: QItemSelection | None = None):
+        # Row of the newly selected candidate (single selection) is its index in self._candidates
+        indexes = selected.indexes()
+        if not indexes:
             return
 
-        item = items[0]
-        idx = self.candidate_list.row(item)
+        idx = indexes[0].row()
         self.selected_address = self._candidates[idx]
+        self._inputs_dirty = True
 
-        # Use the clean string stored in UserRole for map (no [ABA])
-        address_for_map = item.data(Qt.UserRole) or getattr(self.selected_address, "display", "")
+        # Use the clean string kept per row for map (no [ABA])
+        address_for_map = self._candidate_map_addrs[idx] or getattr(self.selected_address, "display", "")
         self._update_map(address_for_map)
 
         # ABA prompt every time for ABA sites (only when not Assistance)
@@ -1297,7 +1709,7 @@ class NoodudkaldQt(QMainWindow):
                 self.on_resolve()
 
         # Log the visible label (includes [ABA], which is fine in logs)
-        self._log(f"Selected: {item.text()} (district {self.selected_address.district_no})")
+        self._log(f"Selected: {indexes[0].data()} (district {self.selected_address.district_no})")
 
     def _extract_incident_label(self, raw: str) -> str:
         """
@@ -1321,10 +1733,14 @@ class NoodudkaldQt(QMainWindow):
         return ""
 
     def _get_units_from_edit(self) -> list[str]:
-        raw = self.units_edit.text().strip()
-        if not raw:
-            return []
-        return [u.strip().upper() for u in raw.replace(",", " ").split() if u.strip()]
+        return _parse_units(self.units_edit.text())
+
+    def _set_preview(self, text: str) -> None:
+        # A re-resolve with unchanged inputs yields the same text; skip the document rebuild/relayout
+        if text == self._preview_shown:
+            return
+        self.preview.setPlainText(text)
+        self._preview_shown = text
 
     def _preview_text(self, alert: str, units: list[str], task_ids: list[int],
                       assistance_unit: str | None = None) -> str:
@@ -1400,8 +1816,7 @@ class NoodudkaldQt(QMainWindow):
                 # Prefer units_edit if operator already changed it
                 units = self._get_units_from_edit()
                 if not units:
-                    units_raw = self.assist_units.text().strip()
-                    units = [u.strip().upper() for u in units_raw.replace(",", " ").split() if u.strip()]
+                    units = _parse_units(self.assist_units.text())
 
                 if not incident_text:
                     raise ValueError("Mangler hændelsestekst til Assistance.")
@@ -1442,7 +1857,7 @@ class NoodudkaldQt(QMainWindow):
                 # keep editable field synced, but do not overwrite operator changes with defaults
                 self.units_edit.setText(" ".join(units))
 
-                self.preview.setPlainText(
+                self._set_preview(
                     self._preview_text(
                         alert=alert,
                         units=units,
@@ -1450,6 +1865,7 @@ class NoodudkaldQt(QMainWindow):
                         assistance_unit=sel.assistance_unit if sel.assistance_added else None,
                     )
                 )
+                self._inputs_dirty = False
                 self._log("Assistance preview ready.")
                 return
 
@@ -1514,7 +1930,7 @@ class NoodudkaldQt(QMainWindow):
             # keep editable field synced
             self.units_edit.setText(" ".join(units))
 
-            self.preview.setPlainText(
+            self._set_preview(
                 self._preview_text(
                     alert=alert,
                     units=units,
@@ -1522,23 +1938,18 @@ class NoodudkaldQt(QMainWindow):
                     assistance_unit=sel.assistance_unit if sel.assistance_added else None,
                 )
             )
+            self._inputs_dirty = False
             self._log("Resolved preview ready.")
 
         except Exception as e:
             self._error("Resolve error", str(e))
 
     def on_send(self):
-
-        def _extract_http_code(msg: str) -> str | None:
-            m = re.search(r"\((\d{3})\)", msg)
-            return m.group(1) if m else None
-
-        progress = None
-
         try:
-            # Always regenerate before sending
-            self._log("Opdaterer preview før afsendelse...")
-            self.on_resolve()
+            # Regenerate before sending, unless nothing changed since the last successful resolve
+            if self._inputs_dirty:
+                self._log("Opdaterer preview før afsendelse...")
+                self.on_resolve()
 
             # rebuild from edited units field
             self.last_alert_text = self._rebuild_alert_text_from_units_edit()
@@ -1548,15 +1959,9 @@ class NoodudkaldQt(QMainWindow):
 
             fsr_prio = FSR_PRIORITY_MAP[self.last_priority]
 
-            from noedudkald.persistence.runtime_paths import ensure_user_data_layout
-            from noedudkald.ui.settings_dialog import LoginDialog
-
-            udata = ensure_user_data_layout()
-            token_path = udata / "secrets" / "fsr_token.json"
-
-            store = TokenStore(token_path)
-            client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk")
+            client, store = self._fsr_send_client()
 
+            creds = None
             token = store.load()
             if token:
                 client.set_token(token)
@@ -1568,67 +1973,87 @@ class NoodudkaldQt(QMainWindow):
                 username, password = dlg.creds()
                 if not username or not password:
                     raise ValueError("Brugernavn/adgangskode mangler.")
+                creds = (username, password)  # login happens on the send worker
+        except Exception as e:
+            self._report_send_error(e)
+            return
 
-                token = client.login_with_password(username, password)
-                store.save(token, username=username)
-                client.set_token(token)
-
-            client.set_persist_token_callback(lambda t: store.save(t))
-
-            total = len(self.last_task_ids)
-            progress = self._make_send_progress(total)
-
-            self._log(f"Sender til FireServiceRota ({total} separate incidents)...")
+        total = len(self.last_task_ids)
+        self._send_progress = self._make_send_progress(total)
+        self.send_btn.setEnabled(False)
+
+        self._log(f"Sender til FireServiceRota ({total} separate incidents)...")
+
+        # Network calls run on the thread pool; the slots below update progress/log/popups
+        worker = _SendWorker(
+            client,
+            store,
+            creds,
+            task_ids=list(self.last_task_ids),
+            body_text=self.last_alert_text,
+            prio=fsr_prio,
+            location=self.last_location,
+        )
+        worker.signals.progress.connect(self._on_send_progress)
+        worker.signals.sent.connect(self._on_send_item)
+        worker.signals.finished.connect(self._on_send_finished)
+        worker.signals.failed.connect(self._on_send_failed)
+        self.thread_pool.start(worker)
 
-            created: list[tuple[int, str | int | None]] = []
+    def _on_send_progress(self, idx: int, task_id: int) -> None:
+        total = self._send_progress.maximum()
+        self._send_progress.setLabelText(
+            f"Sender incident {idx} af {total}...\n"
+            f"Task ID: {task_id}"
+        )
+        self._send_progress.setValue(idx - 1)
 
-            for idx, task_id in enumerate(self.last_task_ids, start=1):
-                progress.setLabelText(
-                    f"Sender incident {idx} af {total}...\n"
-                    f"Task ID: {task_id}"
-                )
-                progress.setValue(idx - 1)
-                QApplication.processEvents()
+    def _on_send_item(self, idx: int, task_id: int, inc_id) -> None:
+        if inc_id:
+            self._log(f"FSR OK – task_id {task_id} -> incident ID {inc_id}")
+        else:
+            self._log(f"FSR OK – task_id {task_id} -> incident oprettet")
 
-                result = client.create_incident(
-                    body_text=self.last_alert_text,
-                    prio=fsr_prio,
-                    location=self.last_location,
-                    task_ids=[task_id],
-                )
+        self._send_progress.setValue(idx)
 
-                inc_id = result.get("id") or result.get("incidentId")
-                created.append((task_id, inc_id))
+    def _on_send_finished(self, created: list[tuple[int, str | int | None]]) -> None:
+        self._send_progress.setLabelText("Afsendelse fuldført.")
+        self._send_progress.setValue(self._send_progress.maximum())
+        self._end_send()
 
+        if len(created) == 1:
+            task_id, inc_id = created[0]
+            if inc_id:
+                self._info("Sendt",
+                           f"Hændelse oprettet i FireServiceRota.\nTask ID: {task_id}\nIncident ID: {inc_id}")
+            else:
+                self._info("Sendt", f"Hændelse oprettet i FireServiceRota.\nTask ID: {task_id}")
+        else:
+            lines = []
+            for task_id, inc_id in created:
                 if inc_id:
-                    self._log(f"FSR OK – task_id {task_id} -> incident ID {inc_id}")
+                    lines.append(f"Task ID {task_id} -> Incident ID {inc_id}")
                 else:
-                    self._log(f"FSR OK – task_id {task_id} -> incident oprettet")
+                    lines.append(f"Task ID {task_id} -> Oprettet")
+            self._info("Sendt", "Separate hændelser oprettet i FireServiceRota:\n\n" + "\n".join(lines))
 
-                progress.setValue(idx)
-                QApplication.processEvents()
+    def _on_send_failed(self, e: Exception) -> None:
+        self._end_send()
+        self._report_send_error(e)
 
-            progress.setLabelText("Afsendelse fuldført.")
-            progress.setValue(total)
-            QApplication.processEvents()
+    def _end_send(self) -> None:
+        self._send_progress.close()
+        self._send_progress = None
+        # Back to the current ready state (the send button follows the resolve button)
+        self.send_btn.setEnabled(self.resolve_btn.isEnabled())
 
-            if len(created) == 1:
-                task_id, inc_id = created[0]
-                if inc_id:
-                    self._info("Sendt",
-                               f"Hændelse oprettet i FireServiceRota.\nTask ID: {task_id}\nIncident ID: {inc_id}")
-                else:
-                    self._info("Sendt", f"Hændelse oprettet i FireServiceRota.\nTask ID: {task_id}")
-            else:
-                lines = []
-                for task_id, inc_id in created:
-                    if inc_id:
-                        lines.append(f"Task ID {task_id} -> Incident ID {inc_id}")
-                    else:
-                        lines.append(f"Task ID {task_id} -> Oprettet")
-                self._info("Sendt", "Separate hændelser oprettet i FireServiceRota:\n\n" + "\n".join(lines))
-
-        except FireServiceRotaAuthError as e:
+    def _report_send_error(self, e: Exception) -> None:
+
+        def _extract_http_code(msg: str) -> str | None:
+            m = _HTTP_CODE_RE.search(msg)
+            return m.group(1) if m else None
+
+        if isinstance(e, FireServiceRotaAuthError):
             code = _extract_http_code(str(e))
             if code:
                 self._log(f"FSR AUTH FEJL (HTTP {code})")
@@ -1636,7 +2061,7 @@ class NoodudkaldQt(QMainWindow):
                 self._log("FSR AUTH FEJL")
             self._error("FSR login fejlede", "Adgang nægtet/ugyldig login (tjek credentials).")
 
-        except FireServiceRotaError as e:
+        elif isinstance(e, FireServiceRotaError):
             code = _extract_http_code(str(e))
             if code:
                 self._log(f"FSR FEJL (HTTP {code})")
@@ -1645,67 +2070,77 @@ class NoodudkaldQt(QMainWindow):
                 self._log("FSR FEJL")
                 self._error("FSR fejl", "Server returnerede en fejl (ukendt HTTP kode).")
 
-        except Exception as e:
+        else:
             self._log("FEJL ved afsendelse")
             self._log(str(e))
             self._error("Fejl", str(e))
 
-        finally:
-            if progress is not None:
-                progress.close()
-
     def _set_ready_state(self, ready: bool):
         self.resolve_btn.setEnabled(ready)
         self.send_btn.setEnabled(ready)
         self.search_btn.setEnabled(ready)
 
-    def _missing_sources(self) -> list[str]:
-        req = [
-            self.paths.addresses_csv,
-            self.paths.aba_xlsx,
-            self.paths.pickliste_xlsx,
-            self.paths.postnummer_xlsx,
-            self.paths.taskids_xlsx,
-        ]
-        return [str(p) for p in req if not p.exists()]
+    def _has_all_sources(self) -> bool:
+        # Readiness only needs a yes/no; ensure_files_exist() lists the missing files by name
+        return not missing_files(self.paths.sources)
 
     def _reload_sources(self):
-        try:
-            self._splash_msg("Indlæser datakilder...")
-            self._log("Indlæser datakilder...")
+        """
+        Loads all sources on the thread pool (the Excel/CSV parsing would freeze the window),
+        then runs the startup checks. Results are swapped in by _on_sources_loaded.
+        """
+        self._splash_msg("Indlæser datakilder...")
+        self._set_header_status("Indlæser datakilder…", "info")
+        self._log("Indlæser datakilder...")
 
-            # Load core data (hub owns these)
-            self.hub = DataHub.from_paths(
-                self.paths.addresses_csv,
-                self.paths.aba_xlsx,
-                self.paths.pickliste_xlsx,
-                self.paths.postnummer_xlsx,
-            )
-            self.hub.load_all()
+        # A newer reload supersedes one still running; its late result is dropped
+        self._sources_gen += 1
+        self._set_ready_state(False)
+        self._inputs_dirty = True  # the new sources may resolve differently
 
-            # Task IDs are separate (not in DataHub)
-            self.task_map = TaskMap(self.paths.taskids_xlsx)
-            self.task_map.load()
+        worker = _SourcesWorker(self._sources_gen, self.paths, self._get_incident_pairs)
+        worker.signals.done.connect(self._on_sources_loaded)
+        worker.signals.failed.connect(self._on_sources_failed)
+        self.thread_pool.start(worker)
 
-            # Build resolver
-            self.resolver = CalloutResolver(
-                incidents=self.hub.incidents,
-                aba=self.hub.aba,
-            )
+    def _on_sources_loaded(self, gen: int, hub: DataHub, task_map: TaskMap, resolver: CalloutResolver, pairs) -> None:
+        if gen != self._sources_gen:
+            return
+
+        try:
+            self.hub = hub
+            self.task_map = task_map
+            self.resolver = resolver
+
+            self._postcode_city = self.hub.postcodes.as_dict()
+            self._label_cache = {}
+            self._aba_flag_cache = {}
 
             self._set_ready_state(True)
             self._log("Datakilder indlæst.")
-            self._install_incident_completer()
-
+            self._install_incident_completer(pairs)
         except Exception as e:
-            self.hub = None
-            self.task_map = None
-            self.resolver = None
-            self._set_ready_state(False)
-            self._splash_msg(f"Datakilde-fejl: {e}")
-            self._set_header_status("Mangler datakilder", "err")  # NEW
-            self._log(f"FEJL ved indlæsning af datakilder: {e}")
+            self._on_sources_failed(gen, str(e))
+            return
+
+        self._splash_msg("Tester FSR...")
+        self._run_startup_checks()
+
+    def _on_sources_failed(self, gen: int, err: str) -> None:
+        if gen != self._sources_gen:
+            return
+
+        self.hub = None
+        self.task_map = None
+        self.resolver = None
+        self._postcode_city = {}
+        self._set_ready_state(False)
+        self._splash_msg(f"Datakilde-fejl: {err}")
+        self._set_header_status("Mangler datakilder", "err")  # NEW
+        self._log(f"FEJL ved indlæsning af datakilder: {err}")
 
+        # Still run checks to complete the splash lifecycle (will end in sources_ok=False)
+        self._run_startup_checks()
 
     def _set_header_status(self, text: str, level: str = "info"):
         """
@@ -1740,15 +2175,18 @@ class NoodudkaldQt(QMainWindow):
         self.manual_assist.setChecked(False)
 
         # BLOCK candidate list signals while clearing selection/items
-        self.candidate_list.blockSignals(True)
+        sel_model = self.candidate_list.selectionModel()
+        sel_model.blockSignals(True)
         try:
-            self.candidate_list.clear()
+            self._cand_model.setStringList([])
         finally:
-            self.candidate_list.blockSignals(False)
+            sel_model.blockSignals(False)
 
         self._candidates = []
+        self._candidate_map_addrs = []
         self.selected_address = None
 
+        self._cancel_incident_suggestions()
         self.incident_code.clear()
         self.aba_p.setChecked(True)
         self.prio1.setChecked(True)
@@ -1767,8 +2205,9 @@ class NoodudkaldQt(QMainWindow):
         self.last_address_display = None
         self.last_city = None
         self.last_aba_site_name = None
+        self._inputs_dirty = True
 
-        self.preview.clear()
+        self._set_preview("")
         self._log("Cleared.")
 
     def _pretty(self, obj) -> str:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 
 import requests
-from PySide6.QtCore import Qt
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QFileDialog, QHBoxLayout, QMessageBox,
@@ -24,6 +27,12 @@ from noedudkald.integrations.token_store import TokenStore
 from noedudkald.persistence.runtime_paths import ensure_user_data_layout
 
 
+# One keep-alive session for "Test FSR" health probes, so repeated tests reuse the TLS connection.
+# No retries: a failed probe should report "offline" straight away.
+_HEALTH_SESSION = requests.Session()
+_HEALTH_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+
 @dataclass(frozen=True)
 class SourceRow:
     label: str
@@ -48,6 +57,9 @@ class SettingsDialog(QDialog):
         self.cfg_mgr = SourceConfig(project_root)
         self.cfg = self.cfg_mgr.load()
 
+        # True once a source file has been replaced (the caller then reloads its sources)
+        self.changed = False
+
         layout = QVBoxLayout(self)
 
         self.form = QFormLayout()
@@ -141,13 +153,33 @@ class SettingsDialog(QDialog):
 
         self.cfg_mgr.input_dir.mkdir(parents=True, exist_ok=True)
 
+        if target.exists() and src.resolve() == target.resolve():
+            raise ValueError("Filen er allerede den aktive datakilde.")
+
+        # Copy next to the target first: if src can't be read, the live file is left untouched.
+        # Bytes only: the loader just parses the file, and a fresh mtime keeps the parse caches honest
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        try:
+            shutil.copyfile(src, tmp)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+
         if target.exists():
             backup = target.with_suffix(target.suffix + ".bak")
             if backup.exists():
                 backup.unlink()
-            shutil.copy2(target, backup)
+            # Rename instead of copying: the old bytes are not rewritten (same folder, same volume)
+            os.replace(target, backup)
 
-        shutil.copy2(src, target)
+        try:
+            os.replace(tmp, target)
+        except Exception:
+            # Put the live file back; the caller has no target to roll back yet
+            if backup is not None:
+                os.replace(backup, target)
+            tmp.unlink(missing_ok=True)
+            raise
         return target, backup
 
     def _rollback(self, target: Path, backup: Path | None):
@@ -157,7 +189,7 @@ class SettingsDialog(QDialog):
         except Exception:
             pass
         if backup and backup.exists():
-            shutil.copy2(backup, target)
+            shutil.copyfile(backup, target)
 
     # ---- validation: only changed source ----
     def _validate_one(self, key: str, path: Path):
@@ -202,6 +234,7 @@ class SettingsDialog(QDialog):
 
             # update config (stores the internal filename)
             self.cfg[key] = target.name
+            self.changed = True
             self.edits[key].setPlaceholderText("Fil ok - tryk gem for at opdatere ")
 
             QMessageBox.information(self, "OK", "Fil valideret og gemt.")
@@ -216,12 +249,23 @@ class SettingsDialog(QDialog):
         prog = self._progress("Tester", "Tester alle datakilder...")
         QApplication.processEvents()
         try:
-            # Validate each required source (fast, but complete)
+            paths = {}
             for row in ROWS:
                 path = self.cfg_mgr.input_dir / self.cfg_mgr.defaults[row.key]
                 if not path.exists():
                     raise FileNotFoundError(f"Mangler fil: {path.name}")
-                self._validate_one(row.key, path)
+                paths[row.key] = path
+
+            # Validate each required source (fast, but complete); the loads are independent, so run them
+            # side by side and keep the dialog painting while they run
+            with ThreadPoolExecutor(max_workers=len(ROWS)) as ex:
+                futures = [ex.submit(self._validate_one, key, path) for key, path in paths.items()]
+                while wait(futures, timeout=0.05).not_done:
+                    QApplication.processEvents()
+
+            # Report the first failing source in ROWS order, as before
+            for f in futures:
+                f.result()
 
             QMessageBox.information(self, "OK", "Alle datakilder er OK.")
         except Exception as e:
@@ -276,30 +320,30 @@ class SettingsDialog(QDialog):
             QMessageBox.critical(self, "FSR login fejlede", str(e))
 
     def on_fsr_test(self):
-        # Test reachability + token validity (samme logik som startup)
-        client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk")
-        store = self._token_store()
-        token = store.load()
+        # Test reachability + token validity (samme logik som startup), off the UI thread
+        self.fsr_test_btn.setEnabled(False)
+        self.fsr_status.setText("Tester FSR…")
 
-        try:
-            r = requests.get("https://www.fireservicerota.co.uk/api/v2/health", timeout=6)
-            if not r.ok:
-                QMessageBox.critical(self, "FSR test", "FSR offline (health fejlede).")
-                return
-        except Exception:
-            QMessageBox.critical(self, "FSR test", "FSR offline (ingen forbindelse).")
-            return
+        worker = _FsrTestWorker(self._token_store())
+        worker.signals.done.connect(self._on_fsr_tested)
+        QThreadPool.globalInstance().start(worker)
 
-        if not token:
-            QMessageBox.warning(self, "FSR test", "FSR er online, men der er ingen token gemt.")
-            return
+    def _on_fsr_tested(self, result: str) -> None:
+        self.fsr_test_btn.setEnabled(True)
 
-        client.set_token(token)
-        server_ok, auth_ok = client.test_connection()
-        if server_ok and auth_ok:
+        if result == "health_failed":
+            QMessageBox.critical(self, "FSR test", "FSR offline (health fejlede).")
+            self._refresh_fsr_status()
+        elif result == "no_connection":
+            QMessageBox.critical(self, "FSR test", "FSR offline (ingen forbindelse).")
+            self._refresh_fsr_status()
+        elif result == "no_token":
+            QMessageBox.warning(self, "FSR test", "FSR er online, men der er ingen token gemt.")
+            self._refresh_fsr_status()
+        elif result == "ok":
             QMessageBox.information(self, "FSR test", "FSR OK (token gyldig).")
             self.fsr_status.setText("Token OK")
-        elif server_ok and not auth_ok:
+        elif result == "auth_failed":
             QMessageBox.warning(self, "FSR test", "FSR online, men token er ugyldig/udløbet.")
             self.fsr_status.setText("Token ugyldig/udløbet")
         else:
@@ -307,6 +351,46 @@ class SettingsDialog(QDialog):
             self.fsr_status.setText("FSR offline")
 
 
+class _FsrTestSignals(QObject):
+    done = Signal(str)  # health_failed | no_connection | no_token | ok | auth_failed | offline
+
+
+class _FsrTestWorker(QRunnable):
+    def __init__(self, store: TokenStore):
+        super().__init__()
+        self.store = store
+        self.signals = _FsrTestSignals()
+
+    def run(self):
+        self.signals.done.emit(self._test())
+
+    def _test(self) -> str:
+        client = FireServiceRotaClient(base_url="https://www.fireservicerota.co.uk")
+        token = self.store.load()
+
+        try:
+            r = _HEALTH_SESSION.get("https://www.fireservicerota.co.uk/api/v2/health", timeout=6)
+            if not r.ok:
+                return "health_failed"
+        except Exception:
+            return "no_connection"
+
+        if not token:
+            return "no_token"
+
+        client.set_token(token)
+        try:
+            server_ok, auth_ok = client.test_connection()
+        except Exception:
+            return "offline"
+
+        if server_ok and auth_ok:
+            return "ok"
+        if server_ok:
+            return "auth_failed"
+        return "offline"
+
+
 class LoginDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)